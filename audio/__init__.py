@@ -6,10 +6,62 @@ PsychoPy initialises its audio subsystem.
 """
 
 import logging
+import re
+import time
+
+# Imported once here so (re)configuration and device listing don't pay
+# the import cost on first call.  ``psychopy.prefs`` does not initialise
+# the audio subsystem — only ``psychopy.sound`` does.
+try:
+    from psychopy import prefs as _prefs
+except ImportError:
+    _prefs = None
+
+try:
+    import sounddevice as _sd
+except ImportError:
+    _sd = None
 
 _configured_device = None
+# device_name of the last configure_audio() that set prefs; None when
+# not yet applied or invalidated by the fallback path
+_applied_device = None
 _logger = logging.getLogger(__name__)
 
+# sounddevice enumeration cache — query_devices() walks the OS audio
+# stack (WASAPI/MME on Windows) and can take hundreds of ms.
+_DEVICES_TTL = 5.0  # seconds
+_devices_cache = {"ts": 0.0, "data": None}
+
+# Legacy Windows virtual devices (MME Sound Mapper etc.) that PTB cannot use
+_LEGACY_RE = re.compile("|".join(map(re.escape, (
+    "Microsoft Sound Mapper", "Primary Sound Driver",
+))))
+
+
+def _get_devices(ttl: float = _DEVICES_TTL):
+    """Return ``sd.query_devices()``, cached for *ttl* seconds.
+
+    Raises whatever sounddevice raises (ImportError, PortAudioError);
+    callers handle failures as before.
+    """
+    now = time.monotonic()
+    if (_devices_cache["data"] is not None
+            and now - _devices_cache["ts"] < ttl):
+        return _devices_cache["data"]
+    if _sd is None:
+        raise ImportError("sounddevice is not installed")
+    devices = _sd.query_devices()
+    _devices_cache["data"] = devices
+    _devices_cache["ts"] = now
+    return devices
+
+
+def refresh_audio_devices() -> None:
+    """Invalidate the cached device list so the next query re-enumerates."""
+    _devices_cache["ts"] = 0.0
+    _devices_cache["data"] = None
+
 
 def configure_audio(device_name: str = "") -> None:
     """Set up PsychoPy audio preferences.
@@ -18,22 +70,21 @@ def configure_audio(device_name: str = "") -> None:
         device_name: Specific audio output device name. Empty string
             for system default.
     """
-    global _configured_device
-    try:
-        from psychopy import prefs
-        prefs.hardware['audioLib'] = ['ptb', 'sounddevice', 'pygame']
-        prefs.hardware['audioLatencyMode'] = 3  # aggressive low-latency
-
-        if device_name:
-            prefs.hardware['audioDevice'] = [device_name]
-            _configured_device = device_name
-        # Otherwise leave audioDevice unset — let PsychoPy/PTB pick the
-        # system default.  Previous code tried to resolve device names
-        # via sounddevice, but those names don't always match what PTB
-        # expects (e.g. "SONY TV (Intel(R) Display Audio)" vs PTB's own
-        # enumeration), causing DeviceNotConnectedError on other PCs.
-    except ImportError:
-        pass
+    global _configured_device, _applied_device
+    if _prefs is None or device_name == _applied_device:
+        return
+    _prefs.hardware['audioLib'] = ['ptb', 'sounddevice', 'pygame']
+    _prefs.hardware['audioLatencyMode'] = 3  # aggressive low-latency
+
+    if device_name:
+        _prefs.hardware['audioDevice'] = [device_name]
+        _configured_device = device_name
+    # Otherwise leave audioDevice unset — let PsychoPy/PTB pick the
+    # system default.  Previous code tried to resolve device names
+    # via sounddevice, but those names don't always match what PTB
+    # expects (e.g. "SONY TV (Intel(R) Display Audio)" vs PTB's own
+    # enumeration), causing DeviceNotConnectedError on other PCs.
+    _applied_device = device_name
 
 
 def reconfigure_audio_fallback() -> None:
@@ -42,13 +93,15 @@ def reconfigure_audio_fallback() -> None:
     Called automatically by AudioManager when the primary backend fails.
     Switches to sounddevice backend which has broader device compatibility.
     """
-    global _configured_device
+    global _configured_device, _applied_device
+    if _prefs is None:
+        return
     try:
-        from psychopy import prefs
-        prefs.hardware['audioLib'] = ['sounddevice', 'pygame']
-        prefs.hardware['audioLatencyMode'] = 0  # safe mode
-        if 'audioDevice' in prefs.hardware:
-            prefs.hardware['audioDevice'] = []
+        _applied_device = None
+        _prefs.hardware['audioLib'] = ['sounddevice', 'pygame']
+        _prefs.hardware['audioLatencyMode'] = 0  # safe mode
+        if 'audioDevice' in _prefs.hardware:
+            _prefs.hardware['audioDevice'] = []
         _configured_device = None
         _logger.info("Audio reconfigured to sounddevice fallback")
     except Exception:
@@ -61,16 +114,14 @@ def list_audio_devices():
     Filters out legacy Windows virtual devices (MME Sound Mapper etc.)
     that PTB cannot use.
     """
-    _LEGACY = {"Microsoft Sound Mapper", "Primary Sound Driver"}
     try:
-        import sounddevice as sd
-        devices = sd.query_devices()
+        devices = _get_devices()
         output_devices = []
         seen = set()
         for d in devices:
             if d['max_output_channels'] > 0:
                 name = d['name']
-                if name not in seen and not any(leg in name for leg in _LEGACY):
+                if name not in seen and _LEGACY_RE.search(name) is None:
                     output_devices.append(name)
                     seen.add(name)
         return output_devices
@@ -78,5 +129,21 @@ def list_audio_devices():
         return []
 
 
+def output_device_indices():
+    """Return ``{device_name: sounddevice_index}`` for output devices.
+
+    The first index wins when several host APIs expose the same name.
+    Uses the cached enumeration; returns ``{}`` if sounddevice fails.
+    """
+    try:
+        indices = {}
+        for i, d in enumerate(_get_devices()):
+            if d['max_output_channels'] > 0:
+                indices.setdefault(d['name'], i)
+        return indices
+    except Exception:
+        return {}
+
+
 # Auto-configure on import with system default
 configure_audio()
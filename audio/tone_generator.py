@@ -2,9 +2,23 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Tuple
+
 import numpy as np
 
 
+@lru_cache(maxsize=8)
+def _make_fade(fade_samples: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return read-only (fade_in, fade_out) half-cosine ramps of *fade_samples*."""
+    ramp = np.linspace(0.0, np.pi, fade_samples, dtype=np.float32)
+    fade_in = 0.5 - 0.5 * np.cos(ramp)
+    fade_out = fade_in[::-1].copy()
+    fade_in.setflags(write=False)
+    fade_out.setflags(write=False)
+    return fade_in, fade_out
+
+
 def generate_sine_tone(
     frequency: float,
     duration: float,
@@ -14,6 +28,10 @@ def generate_sine_tone(
 ) -> np.ndarray:
     """Generate a sine-wave tone as a float32 numpy array.
 
+    Buffers are memoized on the exact parameters, so repeated requests for
+    the same cue cost a dict lookup.  The returned array is shared and
+    read-only — copy it before modifying.
+
     Args:
         frequency: Tone frequency in Hz.
         duration: Duration in seconds.
@@ -22,23 +40,62 @@ def generate_sine_tone(
         fade_ms: Fade-in/out duration in milliseconds to avoid clicks.
 
     Returns:
-        1-D float32 array of samples.
+        1-D read-only float32 array of samples.
     """
+    return _cached_sine_tone(
+        float(frequency), float(duration), int(sample_rate),
+        float(volume), float(fade_ms),
+    )
+
+
+@lru_cache(maxsize=64)
+def _cached_sine_tone(
+    frequency: float,
+    duration: float,
+    sample_rate: int,
+    volume: float,
+    fade_ms: float,
+) -> np.ndarray:
+    wave = _synth_sine_tone(frequency, duration, sample_rate, volume, fade_ms)
+    wave.setflags(write=False)
+    return wave
+
+
+def _synth_sine_tone(
+    frequency: float,
+    duration: float,
+    sample_rate: int,
+    volume: float,
+    fade_ms: float,
+) -> np.ndarray:
+    """Synthesize a fresh, writable tone buffer (uncached)."""
     n_samples = int(sample_rate * duration)
-    t = np.linspace(0, duration, n_samples, endpoint=False, dtype=np.float32)
-    wave = volume * np.sin(2 * np.pi * frequency * t)
+    # Single float32 buffer: sample index -> phase -> sine -> amplitude,
+    # all in place (no intermediate time array).
+    wave = np.arange(n_samples, dtype=np.float32)
+    wave *= np.float32(2 * np.pi * frequency / sample_rate)
+    np.sin(wave, out=wave)
+    wave *= np.float32(volume)
 
-    # Apply fade envelope to avoid clicks
+    # Apply half-cosine fade envelope (in place) to avoid clicks
     fade_samples = int(sample_rate * fade_ms / 1000)
     if fade_samples > 0 and n_samples > 2 * fade_samples:
-        fade_in = np.linspace(0, 1, fade_samples, dtype=np.float32)
-        fade_out = np.linspace(1, 0, fade_samples, dtype=np.float32)
-        wave[:fade_samples] *= fade_in
-        wave[-fade_samples:] *= fade_out
+        fade_in, fade_out = _make_fade(fade_samples)
+        head = wave[:fade_samples]
+        tail = wave[-fade_samples:]
+        np.multiply(head, fade_in, out=head)
+        np.multiply(tail, fade_out, out=tail)
 
     return wave
 
 
 def generate_silence(duration: float, sample_rate: int = 44100) -> np.ndarray:
-    """Generate silence as a float32 numpy array."""
-    return np.zeros(int(sample_rate * duration), dtype=np.float32)
+    """Generate silence as a read-only float32 numpy array (memoized)."""
+    return _cached_silence(int(sample_rate * duration))
+
+
+@lru_cache(maxsize=16)
+def _cached_silence(n_samples: int) -> np.ndarray:
+    buf = np.zeros(n_samples, dtype=np.float32)
+    buf.setflags(write=False)
+    return buf
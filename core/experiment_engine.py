@@ -1,6 +1,6 @@
 """Top-level session orchestrator.
 
-Runs on an ExperimentWorker QThread.  PsychoPy Window and AudioManager
+Runs on the ExperimentWorker engine thread.  PsychoPy Window and AudioManager
 are created on the engine thread because the OpenGL context is
 thread-bound and audio should live alongside it.
 """
@@ -108,8 +108,8 @@ class ExperimentEngine:
         'Unable to share contexts' error on Windows.
         """
         if self._worker is not None:
-            if self._worker.isRunning():
-                self._worker.wait(10000)  # Wait up to 10s for thread to finish
+            if self._worker.is_running():
+                self._worker.join(10.0)  # Wait up to 10s for thread to finish
             self._worker = None
 
         self._protocol = None
@@ -164,12 +164,13 @@ class ExperimentEngine:
 
     def request_abort(self) -> None:
         """Request graceful abort of the entire session."""
-        self._abort_flag.set()
+        already = self._abort_flag.test_and_set()
         self._pause_event.set()   # Unblock if paused
         self._confirm_event.set() # Unblock if waiting
         if self._protocol:
             self._protocol.request_abort()
-        logger.info("Abort requested")
+        if not already:
+            logger.info("Abort requested")
 
     def retry_current(self) -> None:
         """Reset current queue item for retry on next loop iteration."""
@@ -177,7 +178,7 @@ class ExperimentEngine:
             self.queue.reset_current()
         logger.info("Retry requested for current item")
 
-    # --- Main loop (runs on QThread) ---
+    # --- Main loop (runs on the engine thread) ---
 
     def _run(self) -> None:
         """Main experiment loop on the engine thread.
@@ -265,11 +266,13 @@ class ExperimentEngine:
                     break
 
                 # Wait for operator confirmation before each subject turn
-                w.state_changed.emit(ExperimentState.WAITING_CONFIRM)
-                w.progress_text.emit(
-                    f"Waiting for confirmation: {item.subject} - Rep {item.rep}"
-                )
-                w.stimulus_update.emit("idle")
+                with w.batch():
+                    w.post("state_changed", ExperimentState.WAITING_CONFIRM)
+                    w.post(
+                        "progress_text",
+                        f"Waiting for confirmation: {item.subject} - Rep {item.rep}",
+                    )
+                    w.post("stimulus_update", "idle")
                 self._state = ExperimentState.WAITING_CONFIRM
                 self._confirm_event.clear()
                 self._confirm_event.wait()
@@ -339,9 +342,10 @@ class ExperimentEngine:
                         saved_video_paths.add(p)
                         w.recording_saved.emit(p)
 
-                    w.progress_text.emit(
+                    w.post(
+                        "progress_text",
                         f"{item.subject} | Rep {item.rep} | {shape_name} "
-                        f"({shape_idx + 1}/{total_shapes})"
+                        f"({shape_idx + 1}/{total_shapes})",
                     )
 
                     # Beep progress: accumulate across shapes in this turn
@@ -358,10 +362,10 @@ class ExperimentEngine:
                             video_path_factory=make_video_path,
                             is_last_shape=is_last_shape,
                             is_last_queue_item=is_last_queue_item,
-                            on_phase_change=lambda ph, rem: w.phase_changed.emit(ph, rem),
-                            on_stimulus_update=lambda st: w.stimulus_update.emit(st),
-                            on_beep_progress=lambda cur, tot: w.beep_progress.emit(
-                                base_beeps + cur, total_beeps_in_turn,
+                            on_phase_change=lambda ph, rem: w.post("phase_changed", ph, rem),
+                            on_stimulus_update=lambda st: w.post("stimulus_update", st),
+                            on_beep_progress=lambda cur, tot: w.post(
+                                "beep_progress", base_beeps + cur, total_beeps_in_turn,
                             ),
                             on_recording_started=lambda p: w.recording_started.emit(p),
                             on_recording_saved=_track_saved,
@@ -372,6 +376,9 @@ class ExperimentEngine:
                             shape_done = True
                             break
 
+                        # Persist events up to the interruption point
+                        self.event_logger.checkpoint()
+
                         # Trial was interrupted
                         if self._abort_flag.is_set:
                             # Full session abort — keep completed videos
@@ -388,20 +395,21 @@ class ExperimentEngine:
                         # Pause-interrupted: discard only the interrupted
                         # cycle's video, keep completed ones
                         completed = self._protocol.last_completed_cycle
-                        for vp in cycle_videos:
-                            if str(vp) not in saved_video_paths:
-                                self._discard_video(vp)
-                                w.recording_discarded.emit(str(vp))
-
                         resume_cycle = completed + 1
                         total_cycles = self.config.timing.imagination_cycles
-                        w.stimulus_update.emit("idle")
-                        w.progress_text.emit(
-                            f"Paused — cycle {resume_cycle} recording discarded. "
-                            f"({completed}/{total_cycles} cycles saved) "
-                            f"Press Resume to retake cycle {resume_cycle}."
-                        )
-                        w.state_changed.emit(ExperimentState.PAUSED)
+                        with w.batch():
+                            for vp in cycle_videos:
+                                if str(vp) not in saved_video_paths:
+                                    self._discard_video(vp)
+                                    w.post("recording_discarded", str(vp))
+                            w.post("stimulus_update", "idle")
+                            w.post(
+                                "progress_text",
+                                f"Paused — cycle {resume_cycle} recording discarded. "
+                                f"({completed}/{total_cycles} cycles saved) "
+                                f"Press Resume to retake cycle {resume_cycle}.",
+                            )
+                            w.post("state_changed", ExperimentState.PAUSED)
 
                         # Wait for resume
                         self._check_pause(w)
@@ -414,10 +422,11 @@ class ExperimentEngine:
                             self._protocol._abort = False
                         start_from_cycle = resume_cycle
                         w.state_changed.emit(ExperimentState.RUNNING)
-                        w.progress_text.emit(
+                        w.post(
+                            "progress_text",
                             f"{item.subject} | Rep {item.rep} | {shape_name} "
                             f"({shape_idx + 1}/{total_shapes}) "
-                            f"resuming from cycle {resume_cycle}"
+                            f"resuming from cycle {resume_cycle}",
                         )
                         # Continue inner while loop to retry from resume_cycle
 
@@ -486,6 +495,16 @@ class ExperimentEngine:
                 except Exception:
                     pass
             self._win = None
+            if self.session_mgr:
+                try:
+                    self.session_mgr.flush_progress()
+                except Exception as e:
+                    logger.warning("Failed to write progress.json: %s", e)
+            if self.excel_logger:
+                try:
+                    self.excel_logger.finalize()
+                except Exception as e:
+                    logger.warning("Failed to write session_log.xlsx: %s", e)
             w.session_finished.emit()
             if self.event_logger:
                 self.event_logger.close()
@@ -530,6 +549,7 @@ class ExperimentEngine:
                 camera_summary=camera_summary,
                 session_folder=str(self.session_mgr.session_dir),
             )
+            monitor.export_xlsx()
         except Exception as e:
             logger.warning("Failed to log to experiment monitor: %s", e)
 
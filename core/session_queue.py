@@ -61,6 +61,8 @@ class SessionQueue:
                 ))
 
         self._index = 0
+        # Items are fixed after construction, so this never goes stale
+        self._total_shapes = sum(len(item.shapes) for item in self._items)
 
     @property
     def items(self) -> List[QueueItem]:
@@ -80,6 +82,11 @@ class SessionQueue:
     def total(self) -> int:
         return len(self._items)
 
+    @property
+    def total_shapes(self) -> int:
+        """Number of shape trials across all queue items."""
+        return self._total_shapes
+
     @property
     def is_done(self) -> bool:
         return self._index >= len(self._items)
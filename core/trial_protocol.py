@@ -22,7 +22,7 @@ Ver2 trial sequence per shape:
     2. play close_your_eyes.mp3 → wait 5s → play starting.mp3 → wait 2s
     3. Measurement phase: per-cycle imagination with discrete start/end beeps
        and individual camera recordings per cycle
-    4. Post-measurement MP3 based on context
+    4. Post-measurement MP3 based on context (frame-counted 5s wait)
 """
 
 from __future__ import annotations
@@ -32,7 +32,6 @@ from typing import TYPE_CHECKING, Callable, Optional
 
 from config.settings import TimingSettings, AudioSettings
 from core.enums import TrialPhase, Shape
-from utils.timing import precise_sleep
 
 if TYPE_CHECKING:
     from audio.audio_manager import AudioManager
@@ -101,6 +100,7 @@ class TrialProtocol:
         # Instruction wait durations (frame-counted for consistency)
         self._n_close_eyes_wait = stim_window.duration_to_frames(5.0)
         self._n_starting_wait = stim_window.duration_to_frames(2.0)
+        self._n_post_wait = stim_window.duration_to_frames(5.0)
 
         # Extra delay between training and measurement phases
         delay = timing.training_to_measurement_delay
@@ -156,8 +156,19 @@ class TrialProtocol:
         self._abort = False
         resuming = start_from_cycle > 1
 
+        # Local bindings for the frame loops (avoid attribute chains per flip)
+        flip = self._win.flip
+        call_on_flip = self._win.call_on_flip
+        draw_shape = self._win.draw_shape
+        log = self._events.log
+        log_many = self._events.log_many
+        play = self._audio.play
+        stop = self._audio.stop
+
         # Normalize shape to a string name (supports Shape enum or plain string)
         shape_name = shape.value if hasattr(shape, "value") else str(shape)
+        rep_str = str(rep)
+        shape_state = f"shape:{shape_name}"
 
         # Total beeps: 2 per training rep (start+end) + 2 per imagination cycle
         total_beeps = (t.training_repetitions * 2) + (t.imagination_cycles * 2)
@@ -181,13 +192,13 @@ class TrialProtocol:
                 on_beep_progress(beep_counter, total_beeps)
 
         if resuming:
-            self._events.log(
-                "TRIAL_RESUME", subject, shape_name, str(rep),
+            log(
+                "TRIAL_RESUME", subject, shape_name, rep_str,
                 f"from_cycle={start_from_cycle}",
             )
             self.last_completed_cycle = start_from_cycle - 1
         else:
-            self._events.log("TRIAL_START", subject, shape_name, str(rep))
+            log("TRIAL_START", subject, shape_name, rep_str)
             self.last_completed_cycle = 0
 
         # ===== Training + Instruction phases (skipped on resume) =====
@@ -197,24 +208,19 @@ class TrialProtocol:
             for i in range(t.training_repetitions):
                 if self._abort:
                     return False
+                flash = f"flash_{i+1}"
 
                 # --- Shape appears WITH start beep (simultaneous on vsync) ---
                 _phase(TrialPhase.TRAINING_SHAPE, t.training_shape_duration)
-                _stim(f"shape:{shape_name}")
-
-                self._win.draw_shape(shape_name)
-                self._win.call_on_flip(self._audio.play, "start_imagine")
-                self._win.call_on_flip(
-                    self._events.log,
-                    "TRAINING_START_BEEP", subject, shape_name, str(rep),
-                    f"flash_{i+1}",
-                )
-                self._win.call_on_flip(
-                    self._events.log,
-                    "TRAINING_SHAPE_ON", subject, shape_name, str(rep),
-                    f"flash_{i+1}",
-                )
-                self._win.flip()
+                _stim(shape_state)
+
+                draw_shape(shape_name)
+                call_on_flip(play, "start_imagine")
+                call_on_flip(log_many, (
+                    ("TRAINING_START_BEEP", subject, shape_name, rep_str, flash),
+                    ("TRAINING_SHAPE_ON", subject, shape_name, rep_str, flash),
+                ))
+                flip()
                 _beep()
 
                 # Shape stays visible; stop start beep at the right frame
@@ -222,52 +228,46 @@ class TrialProtocol:
                 for f in range(1, self._n_shape):
                     if self._abort:
                         if not beep_stopped:
-                            self._audio.stop("start_imagine")
+                            stop("start_imagine")
                         return False
                     if f == self._n_start_beep:
-                        self._win.call_on_flip(self._audio.stop, "start_imagine")
+                        call_on_flip(stop, "start_imagine")
                         beep_stopped = True
-                    self._win.draw_shape(shape_name)
-                    self._win.flip()
+                    draw_shape(shape_name)
+                    flip()
 
                 # Safety: stop beep if shape was shorter than beep
                 if not beep_stopped:
-                    self._audio.stop("start_imagine")
+                    stop("start_imagine")
 
                 # --- Shape disappears WITH end beep (simultaneous on vsync) ---
                 _phase(TrialPhase.TRAINING_BLANK,
                        self._audio_settings.end_imagine_duration)
-                self._win.call_on_flip(self._audio.play, "end_imagine")
-                self._win.call_on_flip(
-                    self._events.log,
-                    "TRAINING_END_BEEP", subject, shape_name, str(rep),
-                    f"flash_{i+1}",
-                )
-                self._win.call_on_flip(
-                    self._events.log,
-                    "TRAINING_SHAPE_OFF", subject, shape_name, str(rep),
-                    f"flash_{i+1}",
-                )
-                self._win.flip()  # Black frame + end beep starts
+                call_on_flip(play, "end_imagine")
+                call_on_flip(log_many, (
+                    ("TRAINING_END_BEEP", subject, shape_name, rep_str, flash),
+                    ("TRAINING_SHAPE_OFF", subject, shape_name, rep_str, flash),
+                ))
+                flip()  # Black frame + end beep starts
                 _beep()
                 _stim("blank")
 
                 for _ in range(self._n_end_beep - 1):
                     if self._abort:
-                        self._audio.stop("end_imagine")
+                        stop("end_imagine")
                         return False
-                    self._win.flip()
+                    flip()
 
                 # Stop end beep at vsync
-                self._win.call_on_flip(self._audio.stop, "end_imagine")
-                self._win.flip()
+                call_on_flip(stop, "end_imagine")
+                flip()
 
                 # --- Blank gap (silence, black screen) ---
                 _phase(TrialPhase.TRAINING_BLANK, t.training_blank_duration)
                 for _ in range(self._n_blank - 1):
                     if self._abort:
                         return False
-                    self._win.flip()
+                    flip()
 
             # ===== Optional delay between training and measurement =====
             if self._n_train_to_meas_delay > 0:
@@ -278,7 +278,7 @@ class TrialProtocol:
                 for _ in range(self._n_train_to_meas_delay):
                     if self._abort:
                         return False
-                    self._win.flip()
+                    flip()
 
             # ===== Instruction sequence: close your eyes =====
             if self._abort:
@@ -287,27 +287,27 @@ class TrialProtocol:
             _phase(TrialPhase.INSTRUCTION_CLOSE_EYES, 5.0)
             _stim("instruction:close_eyes")
             self._audio.play_instruction("close_your_eyes")
-            self._events.log("INSTRUCTION_CLOSE_EYES", subject, shape_name, str(rep))
+            log("INSTRUCTION_CLOSE_EYES", subject, shape_name, rep_str)
 
             # Wait 5 seconds (frame-counted)
             _phase(TrialPhase.INSTRUCTION_WAIT, 5.0)
             for _ in range(self._n_close_eyes_wait):
                 if self._abort:
                     return False
-                self._win.flip()
+                flip()
 
             # Play "starting" instruction
             _phase(TrialPhase.INSTRUCTION_STARTING, 2.0)
             _stim("instruction:starting")
             self._audio.play_instruction("starting")
-            self._events.log("INSTRUCTION_STARTING", subject, shape_name, str(rep))
+            log("INSTRUCTION_STARTING", subject, shape_name, rep_str)
 
             # Wait 2 seconds
             _phase(TrialPhase.INSTRUCTION_READY, 2.0)
             for _ in range(self._n_starting_wait):
                 if self._abort:
                     return False
-                self._win.flip()
+                flip()
 
         # ===== Measurement phase (per-cycle imagination with recording) =====
         if self._abort:
@@ -328,31 +328,34 @@ class TrialProtocol:
                 return False
 
             cycle_num = i + 1
+            cycle = f"cycle_{cycle_num}"
             cycle_video_path = video_path_factory(cycle_num)
+            cycle_video_str = str(cycle_video_path)
+            recording_start_detail = f"{cycle} path={cycle_video_path}"
 
             # --- Play start-imagining beep ---
             _phase(
                 TrialPhase.MEASUREMENT_START_BEEP,
                 self._audio_settings.start_imagine_duration,
             )
-            self._win.call_on_flip(self._audio.play, "start_imagine")
-            self._win.call_on_flip(
-                self._events.log,
-                "IMAGINATION_START_BEEP", subject, shape_name, str(rep),
-                f"cycle_{cycle_num}",
+            call_on_flip(play, "start_imagine")
+            call_on_flip(
+                log,
+                "IMAGINATION_START_BEEP", subject, shape_name, rep_str,
+                cycle,
             )
-            self._win.flip()
+            flip()
             _beep()
 
             for _ in range(self._n_start_beep - 1):
                 if self._abort:
-                    self._audio.stop("start_imagine")
+                    stop("start_imagine")
                     return False
-                self._win.flip()
+                flip()
 
             # Stop start beep at vsync
-            self._win.call_on_flip(self._audio.stop, "start_imagine")
-            self._win.flip()
+            call_on_flip(stop, "start_imagine")
+            flip()
 
             # --- Recording delay (silence, camera not yet recording) ---
             _phase(
@@ -362,15 +365,15 @@ class TrialProtocol:
             for _ in range(self._n_recording_delay - 1):
                 if self._abort:
                     return False
-                self._win.flip()
+                flip()
 
             # --- Start camera recording ---
             self._camera.start_recording(cycle_video_path, fps)
             if on_recording_started:
-                on_recording_started(str(cycle_video_path))
-            self._events.log(
-                "RECORDING_START", subject, shape_name, str(rep),
-                f"cycle_{cycle_num} path={cycle_video_path}",
+                on_recording_started(cycle_video_str)
+            log(
+                "RECORDING_START", subject, shape_name, rep_str,
+                recording_start_detail,
             )
 
             # --- Active imagination period (camera is recording) ---
@@ -382,16 +385,16 @@ class TrialProtocol:
                 if self._abort:
                     self._camera.stop_recording()
                     return False
-                self._win.flip()
+                flip()
 
             # --- Stop camera before end beep ---
             frames = self._camera.stop_recording()
             total_frames_recorded += frames
             if on_recording_saved:
-                on_recording_saved(str(cycle_video_path))
-            self._events.log(
-                "RECORDING_STOP", subject, shape_name, str(rep),
-                f"cycle_{cycle_num} frames={frames}",
+                on_recording_saved(cycle_video_str)
+            log(
+                "RECORDING_STOP", subject, shape_name, rep_str,
+                f"{cycle} frames={frames}",
             )
 
             # --- Play end-imagining beep ---
@@ -399,24 +402,24 @@ class TrialProtocol:
                 TrialPhase.MEASUREMENT_END_BEEP,
                 self._audio_settings.end_imagine_duration,
             )
-            self._win.call_on_flip(self._audio.play, "end_imagine")
-            self._win.call_on_flip(
-                self._events.log,
-                "IMAGINATION_END_BEEP", subject, shape_name, str(rep),
-                f"cycle_{cycle_num}",
+            call_on_flip(play, "end_imagine")
+            call_on_flip(
+                log,
+                "IMAGINATION_END_BEEP", subject, shape_name, rep_str,
+                cycle,
             )
-            self._win.flip()
+            flip()
             _beep()
 
             for _ in range(self._n_end_beep - 1):
                 if self._abort:
-                    self._audio.stop("end_imagine")
+                    stop("end_imagine")
                     return False
-                self._win.flip()
+                flip()
 
             # Stop end beep at vsync
-            self._win.call_on_flip(self._audio.stop, "end_imagine")
-            self._win.flip()
+            call_on_flip(stop, "end_imagine")
+            flip()
 
             # Cycle fully completed (recording saved + end beep played)
             self.last_completed_cycle = cycle_num
@@ -430,31 +433,39 @@ class TrialProtocol:
                 for _ in range(self._n_inter_delay):
                     if self._abort:
                         return False
-                    self._win.flip()
+                    flip()
 
         # ===== Post-measurement instruction =====
         _phase(TrialPhase.INSTRUCTION_POST, 5.0)
 
+        n_post_wait = self._n_post_wait
         if not is_last_shape:
             _stim("instruction:open_your_eyes")
             self._audio.play_instruction("open_your_eyes")
-            self._events.log("INSTRUCTION_OPEN_EYES", subject, shape_name, str(rep))
-            precise_sleep(5.0)
+            log("INSTRUCTION_OPEN_EYES", subject, shape_name, rep_str)
         elif is_last_queue_item:
             _stim("instruction:experiment_completed")
             self._audio.play_instruction("experiment_completed")
-            self._events.log("INSTRUCTION_COMPLETED", subject, shape_name, str(rep))
+            log("INSTRUCTION_COMPLETED", subject, shape_name, rep_str)
             mp3_dur = self._audio.get_instruction_duration("experiment_completed")
-            precise_sleep(max(5.0, mp3_dur + 1.0))
+            n_post_wait = self._win.duration_to_frames(max(5.0, mp3_dur + 1.0))
         else:
             _stim("instruction:next_participant")
             self._audio.play_instruction("next_participant_please")
-            self._events.log("INSTRUCTION_NEXT_PARTICIPANT", subject, shape_name, str(rep))
-            precise_sleep(5.0)
+            log("INSTRUCTION_NEXT_PARTICIPANT", subject, shape_name, rep_str)
+
+        # Frame-counted wait while the MP3 plays.  All cycles are already
+        # saved, so an abort/pause only cuts the wait short — the trial
+        # still counts as completed.
+        for _ in range(n_post_wait):
+            if self._abort:
+                break
+            flip()
 
         _stim("idle")
-        self._events.log(
-            "TRIAL_END", subject, shape_name, str(rep),
+        log(
+            "TRIAL_END", subject, shape_name, rep_str,
             f"total_frames={total_frames_recorded} cycles={t.imagination_cycles}",
         )
+        self._events.checkpoint()
         return True
@@ -4,30 +4,56 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 # Store relative to the codebase root for portability
 _MEMORY_DIR = Path(__file__).resolve().parent.parent / ".app_memory"
 _MEMORY_FILE = _MEMORY_DIR / "memory.json"
 
+# Mutations within this window are coalesced into a single disk write
+_SAVE_DEBOUNCE_S = 0.5
+
 
 class AppMemory:
     """Persistent cross-session memory for the experiment application.
 
     Stores last-used output folder, subject history, settings, and
     camera settings in a JSON file within the codebase directory.
+
+    The ``add_*`` / ``update_*`` mutators schedule a debounced save
+    instead of writing immediately; call ``save()`` to persist now or
+    ``flush()`` to persist only if there are pending changes.
     """
 
     def __init__(self):
         self.last_output_folder: str = ""
-        self.subject_history: List[str] = []
+        # Insertion-ordered set of subject names (values unused)
+        self._history: Dict[str, None] = {}
         self.last_settings: Dict = {}
         self.last_camera_settings: Dict = {}
         self.last_audio_device: str = ""
         self.last_screen_index: int = -1
+        # _save_lock guards _dirty, the snapshot and _save_timer (held
+        # briefly); _write_lock orders snapshot + disk write so an older
+        # snapshot can never land on disk after a newer one.
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
         self.load()
 
     def load(self) -> None:
@@ -38,7 +64,7 @@ class AppMemory:
             with open(_MEMORY_FILE, "r", encoding="utf-8") as f:
                 data = json.load(f)
             self.last_output_folder = data.get("last_output_folder", "")
-            self.subject_history = data.get("subject_history", [])
+            self._history = dict.fromkeys(data.get("subject_history", []))
             self.last_settings = data.get("last_settings", {})
             self.last_camera_settings = data.get("last_camera_settings", {})
             self.last_audio_device = data.get("last_audio_device", "")
@@ -48,42 +74,105 @@ class AppMemory:
             logger.warning("Failed to load app memory: %s", e)
 
     def save(self) -> None:
-        """Persist memory to disk."""
+        """Persist memory to disk (cancels any pending debounced save)."""
+        self._cancel_timer()
+        self._persist(force=True)
+
+    def flush(self) -> None:
+        """Write pending changes immediately, if any (call on shutdown)."""
+        self._cancel_timer()
+        self._persist(force=False)
+
+    def _schedule_save(self) -> None:
+        """Mark memory dirty and (re)arm the debounced save timer."""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            timer = threading.Timer(_SAVE_DEBOUNCE_S, self._on_timer)
+            timer.args = (timer,)
+            timer.daemon = True
+            self._save_timer = timer
+            timer.start()
+
+    def _cancel_timer(self) -> None:
+        with self._save_lock:
+            timer, self._save_timer = self._save_timer, None
+        if timer is not None:
+            timer.cancel()
+
+    def _on_timer(self, timer: threading.Timer) -> None:
+        # Only forget our own timer; one armed meanwhile stays scheduled
+        with self._save_lock:
+            if self._save_timer is timer:
+                self._save_timer = None
+        self._persist(force=False)
+
+    def _persist(self, force: bool) -> None:
+        with self._write_lock:
+            with self._save_lock:
+                if not (force or self._dirty):
+                    return
+                # Snapshot and clear together: a mutation after this
+                # point re-marks dirty and is written by the next save
+                data = self._snapshot()
+                self._dirty = False
+            if not self._write(data):
+                with self._save_lock:
+                    self._dirty = True
+
+    def _snapshot(self) -> Dict:
+        return {
+            "last_output_folder": self.last_output_folder,
+            "subject_history": list(self._history),
+            "last_settings": dict(self.last_settings),
+            "last_camera_settings": dict(self.last_camera_settings),
+            "last_audio_device": self.last_audio_device,
+            "last_screen_index": self.last_screen_index,
+        }
+
+    def _write(self, data: Dict) -> bool:
+        """Write *data* atomically; return False on failure."""
         try:
             _MEMORY_DIR.mkdir(parents=True, exist_ok=True)
-            data = {
-                "last_output_folder": self.last_output_folder,
-                "subject_history": self.subject_history,
-                "last_settings": self.last_settings,
-                "last_camera_settings": self.last_camera_settings,
-                "last_audio_device": self.last_audio_device,
-                "last_screen_index": self.last_screen_index,
-            }
-            with open(_MEMORY_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            # Write to a temp file and rename so a crash mid-write never
+            # leaves a truncated memory.json behind.
+            tmp = _MEMORY_FILE.with_suffix(".json.tmp")
+            with open(tmp, "wb") as f:
+                f.write(_dumps(data))
+            os.replace(tmp, _MEMORY_FILE)
             logger.debug("App memory saved to %s", _MEMORY_FILE)
+            return True
         except Exception as e:
             logger.warning("Failed to save app memory: %s", e)
+            return False
 
     def add_subjects(self, names: List[str]) -> None:
         """Add subject names to history (deduplicated, preserving order)."""
-        seen = set(self.subject_history)
         for name in names:
-            if name and name not in seen:
-                self.subject_history.append(name)
-                seen.add(name)
-        self.save()
+            if name:
+                self._history.setdefault(name, None)
+        self._schedule_save()
 
     def get_subject_history(self) -> List[str]:
         """Return all previously-used subject names."""
-        return list(self.subject_history)
+        return list(self._history)
+
+    @property
+    def subject_history(self) -> List[str]:
+        """Previously-used subject names in first-seen order (a copy)."""
+        return list(self._history)
+
+    @subject_history.setter
+    def subject_history(self, names: List[str]) -> None:
+        self._history = dict.fromkeys(names)
 
     def update_settings(self, config_dict: dict) -> None:
         """Store last-used experiment settings."""
         self.last_settings = config_dict
-        self.save()
+        self._schedule_save()
 
     def update_camera_settings(self, camera_dict: dict) -> None:
         """Store last-used camera settings."""
         self.last_camera_settings = camera_dict
-        self.save()
+        self._schedule_save()
@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
-import csv
+import os
+import re
 import threading
 import time
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import Deque, Iterable, List, Optional, Tuple
+
+_NEEDS_QUOTE = re.compile(r'[",\r\n]')
+
+
+def _q(field: str) -> str:
+    """Quote a CSV field only if it contains a delimiter, quote or newline."""
+    if _NEEDS_QUOTE.search(field) is None:
+        return field
+    return '"' + field.replace('"', '""') + '"'
 
 
 class EventLogger:
@@ -14,6 +25,15 @@ class EventLogger:
 
     Each row: timestamp_s, elapsed_ms, event_type, subject, shape, rep, detail
 
+    ``log()`` only formats the row and appends it to an in-memory queue;
+    a background writer thread drains the queue to disk with a single
+    unbuffered ``os.write`` per batch.  The writer is woken once
+    ``FLUSH_EVERY`` rows are pending and otherwise every
+    ``FLUSH_INTERVAL_S`` seconds.  ``checkpoint()`` drains and fsyncs
+    synchronously; ``close()`` drains and closes.  The last
+    ``RECENT_MAX`` rows are also kept in memory for inspection via
+    ``recent()``.
+
     All public methods are thread-safe.
     """
 
@@ -22,14 +42,33 @@ class EventLogger:
         "subject", "shape", "rep", "detail",
     ]
 
+    FLUSH_EVERY = 16
+    FLUSH_INTERVAL_S = 1.0
+    RECENT_MAX = 1024
+
     def __init__(self, path: Path):
         self._path = path
-        self._lock = threading.Lock()
+        self._lock = threading.Lock()  # guards the file descriptor
         self._start_time: Optional[float] = None
-        self._file = open(path, "w", newline="", encoding="utf-8")
-        self._writer = csv.writer(self._file)
-        self._writer.writerow(self.HEADER)
-        self._file.flush()
+        # Raw fd: rows are pre-encoded and batched in memory, so there is
+        # no Python-level buffering layer.  O_BINARY stops Windows from
+        # translating line endings.
+        self._fd: Optional[int] = os.open(
+            str(path),
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+            0o644,
+        )
+        self._write_all((",".join(self.HEADER) + "\r\n").encode("utf-8"))
+
+        # deque append/popleft are atomic, so log() needs no lock
+        self._pending: Deque[bytes] = deque()
+        self._recent: Deque[bytes] = deque(maxlen=self.RECENT_MAX)
+        self._wakeup = threading.Event()
+        self._stop = False
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="EventLogWriter", daemon=True,
+        )
+        self._writer.start()
 
     def start_clock(self) -> None:
         """Set the reference time for elapsed_ms calculation."""
@@ -43,21 +82,88 @@ class EventLogger:
         rep: str = "",
         detail: str = "",
     ) -> None:
-        """Append one event row (thread-safe)."""
+        """Queue one event row (thread-safe, never touches the disk)."""
         now = time.perf_counter()
-        elapsed = (now - self._start_time) * 1000 if self._start_time else 0.0
+        start = self._start_time
+        elapsed = (now - start) * 1000 if start else 0.0
+        self._enqueue(
+            self._format(now, elapsed, event_type, subject, shape, rep, detail)
+        )
+
+    def log_many(self, events: Iterable[Tuple[str, ...]]) -> None:
+        """Queue several event rows sharing a single timestamp.
+
+        Each item is a tuple of ``log()`` positional arguments, e.g.
+        ``("TRAINING_SHAPE_ON", subject, shape, rep, detail)``.  Intended
+        for events that happen at the same instant (one flip callback).
+        """
+        now = time.perf_counter()
+        start = self._start_time
+        elapsed = (now - start) * 1000 if start else 0.0
+        for ev in events:
+            self._enqueue(self._format(now, elapsed, *ev))
+
+    @staticmethod
+    def _format(
+        now: float,
+        elapsed: float,
+        event_type: str,
+        subject: str = "",
+        shape: str = "",
+        rep: str = "",
+        detail: str = "",
+    ) -> bytes:
+        return (
+            f"{now:.6f},{elapsed:.3f},{_q(event_type)},{_q(subject)},"
+            f"{_q(shape)},{_q(rep)},{_q(detail)}\r\n"
+        ).encode("utf-8")
+
+    def _enqueue(self, row: bytes) -> None:
+        self._pending.append(row)
+        self._recent.append(row)
+        if len(self._pending) >= self.FLUSH_EVERY:
+            self._wakeup.set()
+
+    def recent(self) -> List[str]:
+        """Return the most recent rows (up to ``RECENT_MAX``), oldest first."""
+        return [r.decode("utf-8").rstrip("\r\n") for r in list(self._recent)]
+
+    def checkpoint(self) -> None:
+        """Write all queued rows and fsync (call at trial boundaries)."""
         with self._lock:
-            self._writer.writerow([
-                f"{now:.6f}",
-                f"{elapsed:.3f}",
-                event_type,
-                subject,
-                shape,
-                rep,
-                detail,
-            ])
-            self._file.flush()
+            if self._fd is not None:
+                self._drain_locked()
+                os.fsync(self._fd)
+
+    def _writer_loop(self) -> None:
+        while not self._stop:
+            self._wakeup.wait(self.FLUSH_INTERVAL_S)
+            self._wakeup.clear()
+            with self._lock:
+                if self._fd is not None:
+                    self._drain_locked()
+
+    def _drain_locked(self) -> None:
+        pending = self._pending
+        if not pending:
+            return
+        popleft = pending.popleft
+        batch = [popleft() for _ in range(len(pending))]
+        self._write_all(b"".join(batch))
+
+    def _write_all(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            n = os.write(self._fd, view)
+            view = view[n:]
 
     def close(self) -> None:
+        self._stop = True
+        self._wakeup.set()
+        if self._writer.is_alive() and self._writer is not threading.current_thread():
+            self._writer.join(timeout=2.0)
         with self._lock:
-            self._file.close()
+            if self._fd is not None:
+                self._drain_locked()
+                os.close(self._fd)
+                self._fd = None
@@ -2,19 +2,48 @@
 
 from __future__ import annotations
 
+import csv
+import logging
+import os
+import queue
 import threading
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Optional
+
+try:
+    from openpyxl import Workbook
+    from openpyxl.utils import get_column_letter
+except ImportError:
+    Workbook = None
+    get_column_letter = None
+
+logger = logging.getLogger(__name__)
+
+
+def _to_number(value: str):
+    """Convert a CSV cell back to int/float for the xlsx; keep text as-is."""
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
 
 
 class ExcelLogger:
-    """Maintains a session_log.xlsx with one row per completed trial.
+    """Maintains the per-trial session log with one row per completed trial.
 
     Columns: timestamp, subject, shape, rep, status, video_file, notes
 
-    All public methods are thread-safe. The workbook is saved after
-    every write to ensure data is not lost on crash.
+    ``log_trial()`` only queues the row; a single daemon writer thread
+    appends queued rows to ``session_log.csv`` in batches with one fsync
+    per batch, so the experiment thread never waits on disk I/O.
+    ``session_log.xlsx`` is generated from the CSV once, by
+    ``finalize()`` at session end.
+
+    All public methods are thread-safe.
     """
 
     HEADER = [
@@ -24,29 +53,75 @@ class ExcelLogger:
         "offset_x", "offset_y", "gamma",
     ]
 
+    # Columns converted back to numbers when building the xlsx
+    _NUMERIC = frozenset({
+        "rep", "exposure_us", "gain_db", "fps",
+        "offset_x", "offset_y", "gamma",
+    })
+
+    _BATCH_MAX = 64
+    _STOP = object()  # writer-thread sentinel
+
     def __init__(self, path: Path):
         self._path = path
+        self._csv_path = path.with_suffix(".csv")
         self._lock = threading.Lock()
-        self._wb: Optional[object] = None
-        self._ws: Optional[object] = None
-        self._init_workbook()
-
-    def _init_workbook(self) -> None:
+        self._q: "queue.Queue" = queue.Queue()
+        self._writer: threading.Thread | None = None
+        # (epoch second, formatted string) of the last row timestamp
+        self._ts_cache = (-1, "")
         try:
-            from openpyxl import Workbook
-            self._wb = Workbook()
-            self._ws = self._wb.active
-            self._ws.title = "Session Log"
-            self._ws.append(self.HEADER)
-            # Auto-width for header
-            for col_idx, header in enumerate(self.HEADER, 1):
-                self._ws.column_dimensions[
-                    chr(64 + col_idx)
-                ].width = max(len(header) + 2, 15)
-            self._wb.save(str(self._path))
-        except ImportError:
-            self._wb = None
-            self._ws = None
+            self._csv_fp = open(
+                self._csv_path, "a", newline="", encoding="utf-8",
+                buffering=1,
+            )
+        except OSError as e:
+            logger.error("Cannot open session log %s: %s", self._csv_path, e)
+            self._csv_fp = None
+            return
+        self._csv = csv.writer(self._csv_fp)
+        if self._csv_fp.tell() == 0:
+            self._csv.writerow(self.HEADER)
+            self._sync()
+        self._writer = threading.Thread(
+            target=self._drain, name="ExcelLogWriter", daemon=True,
+        )
+        self._writer.start()
+
+    def _drain(self) -> None:
+        """Writer thread: append queued rows in batches, one fsync each."""
+        stop = False
+        while not stop:
+            batch = [self._q.get()]
+            while len(batch) < self._BATCH_MAX:
+                try:
+                    batch.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is self._STOP:
+                batch.pop()
+                stop = True
+            if not batch:
+                continue
+            try:
+                self._csv.writerows(batch)
+                self._sync()
+            except Exception as e:
+                logger.error("Failed to write session log rows: %s", e)
+
+    def _timestamp(self) -> str:
+        """Local ``YYYY-mm-dd HH:MM:SS``, formatted at most once per second."""
+        sec = int(time.time())
+        cached_sec, cached = self._ts_cache
+        if sec != cached_sec:
+            cached = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+            # Single tuple assignment keeps second and string consistent
+            self._ts_cache = (sec, cached)
+        return cached
+
+    def _sync(self) -> None:
+        self._csv_fp.flush()
+        os.fsync(self._csv_fp.fileno())
 
     def log_trial(
         self,
@@ -58,33 +133,83 @@ class ExcelLogger:
         notes: str = "",
         camera_settings: dict | None = None,
     ) -> None:
-        """Append a trial result row and save immediately.
+        """Queue a trial result row for the CSV writer thread.
 
         Args:
             camera_settings: Optional dict with keys: exposure_us, gain_db,
                 fps, offset_x, offset_y, gamma.
         """
-        if self._ws is None:
+        if self._csv_fp is None:
             return
         cs = camera_settings or {}
+        row = [
+            self._timestamp(),
+            subject,
+            shape,
+            rep,
+            status,
+            video_file,
+            notes,
+            cs.get("exposure_us", ""),
+            cs.get("gain_db", ""),
+            cs.get("fps", ""),
+            cs.get("offset_x", ""),
+            cs.get("offset_y", ""),
+            cs.get("gamma", ""),
+        ]
+        self._q.put(row)
+
+    def close(self) -> None:
+        """Drain pending rows, stop the writer thread and close the CSV."""
         with self._lock:
-            self._ws.append([
-                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                subject,
-                shape,
-                rep,
-                status,
-                video_file,
-                notes,
-                cs.get("exposure_us", ""),
-                cs.get("gain_db", ""),
-                cs.get("fps", ""),
-                cs.get("offset_x", ""),
-                cs.get("offset_y", ""),
-                cs.get("gamma", ""),
-            ])
-            self._wb.save(str(self._path))
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        if self._writer is not None:
+            self._q.put(self._STOP)
+            self._writer.join()
+            self._writer = None
+        if self._csv_fp is not None and not self._csv_fp.closed:
+            self._sync()
+            self._csv_fp.close()
+
+    def finalize(self) -> None:
+        """Close the CSV and write ``session_log.xlsx`` from it.
+
+        Uses an openpyxl write-only workbook so rows are streamed.
+        Skipped (CSV only) if openpyxl is not installed.
+        """
+        with self._lock:
+            if self._csv_fp is None:
+                return
+            self._close_locked()
+            if Workbook is None:
+                logger.warning("openpyxl not available — session log kept as CSV only")
+                return
+
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Session Log")
+            # Auto-width for header (must be set before rows are written)
+            for letter, width in _COL_WIDTHS.items():
+                ws.column_dimensions[letter].width = width
+            numeric = [h in self._NUMERIC for h in self.HEADER]
+            with open(self._csv_path, "r", newline="", encoding="utf-8") as f:
+                reader = csv.reader(f)
+                ws.append(next(reader, self.HEADER))
+                for row in reader:
+                    ws.append([
+                        _to_number(v) if num and v else v
+                        for v, num in zip(row, numeric)
+                    ])
+            wb.save(str(self._path))
 
     @property
     def available(self) -> bool:
-        return self._wb is not None
+        return self._csv_fp is not None
+
+
+# Column letter -> header width for the xlsx, computed once at import
+_COL_WIDTHS = {
+    get_column_letter(i): max(len(h) + 2, 15)
+    for i, h in enumerate(ExcelLogger.HEADER, 1)
+} if get_column_letter else {}
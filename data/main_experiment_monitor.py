@@ -1,20 +1,33 @@
-"""Cross-session experiment monitoring Excel log."""
+"""Cross-session experiment monitoring log (CSV record + Excel export)."""
 
 from __future__ import annotations
 
+import csv
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
+try:
+    from openpyxl import Workbook, load_workbook
+    from openpyxl.utils import get_column_letter
+except ImportError:
+    Workbook = load_workbook = None
+    get_column_letter = None
+
 logger = logging.getLogger(__name__)
 
 
 class MainExperimentMonitor:
-    """Creates/updates MAIN_experiment_monitoring.xlsx in the output base directory.
+    """Maintains MAIN_experiment_monitoring in the output base directory.
 
-    Appends one row per session with summary information.
-    This file persists across sessions and is never overwritten.
+    Appends one row per session with summary information to
+    ``MAIN_experiment_monitoring.csv`` — the canonical record, which
+    persists across sessions and is never overwritten.
+    ``MAIN_experiment_monitoring.xlsx`` is only a view: it is
+    regenerated from the CSV by ``export_xlsx()`` every session, so
+    edits made to it are lost and logging a session never has to load
+    the whole historical workbook.
     """
 
     HEADER = [
@@ -30,8 +43,13 @@ class MainExperimentMonitor:
         "Output Session Folder",
     ]
 
+    # Columns converted back to numbers when exporting the xlsx
+    _NUMERIC = frozenset({"Repetitions", "Shape Reps Per SubSession"})
+
     def __init__(self, output_base_dir: str):
-        self._path = Path(output_base_dir) / "MAIN_experiment_monitoring.xlsx"
+        base = Path(output_base_dir)
+        self._path = base / "MAIN_experiment_monitoring.xlsx"
+        self._csv_path = base / "MAIN_experiment_monitoring.csv"
 
     def log_session(
         self,
@@ -45,42 +63,137 @@ class MainExperimentMonitor:
         camera_summary: str,
         session_folder: str,
     ) -> None:
-        """Append a session summary row to the monitoring Excel file."""
+        """Append a session summary row to the monitoring CSV."""
+        try:
+            if not self._csv_path.exists() and not self._create_csv():
+                return
+            with open(self._csv_path, "a", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerow([
+                    start_time.strftime("%Y-%m-%d"),
+                    start_time.strftime("%H:%M:%S"),
+                    end_time.strftime("%H:%M:%S"),
+                    status,
+                    ", ".join(participants),
+                    ", ".join(shapes),
+                    repetitions,
+                    shape_reps_per_subsession,
+                    camera_summary,
+                    session_folder,
+                ])
+            logger.info("Session logged to %s", self._csv_path)
+        except Exception as e:
+            logger.error("Failed to log session to monitor: %s", e)
+
+    def _create_csv(self) -> bool:
+        """Create the CSV, carrying over rows from a pre-CSV xlsx log.
+
+        Returns False (and creates nothing) while a legacy xlsx that
+        could neither be imported nor renamed is still in place, so the
+        import is retried next session instead of being exported over.
+        """
+        self._csv_path.parent.mkdir(parents=True, exist_ok=True)
+        rows = self._read_legacy_xlsx() if self._path.exists() else []
+        if rows is None:
+            return False
+        with open(self._csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.HEADER)
+            writer.writerows(rows)
+        return True
+
+    def _read_legacy_xlsx(self) -> Optional[list]:
+        """Return the data rows of an existing xlsx monitor log.
+
+        If it cannot be read (or openpyxl is missing), it is renamed
+        aside so a later export does not overwrite the only copy of
+        that history; returns None if even that fails.
+        """
+        if load_workbook is None:
+            # The CSV created now stops any later import, and a run that
+            # has openpyxl would then export over the old workbook
+            return self._set_aside_legacy_xlsx("openpyxl is not installed")
+        try:
+            wb = load_workbook(str(self._path), read_only=True)
+            try:
+                rows = [
+                    ["" if v is None else v for v in row]
+                    for row in wb.active.iter_rows(min_row=2, values_only=True)
+                ]
+            finally:
+                wb.close()
+            logger.info(
+                "Imported %d rows from existing %s", len(rows), self._path.name,
+            )
+            return rows
+        except Exception as e:
+            return self._set_aside_legacy_xlsx(e)
+
+    def _set_aside_legacy_xlsx(self, reason) -> Optional[list]:
+        """Rename the unimported xlsx log to a fresh backup name.
+
+        Returns no rows to import, or None if the rename failed.
+        """
+        backup = self._free_backup_path()
+        logger.warning(
+            "Could not read %s (%s) — keeping it as %s",
+            self._path, reason, backup.name,
+        )
+        try:
+            # rename, not replace: never clobber an earlier backup
+            self._path.rename(backup)
+        except OSError as err:
+            logger.error(
+                "Could not rename %s to %s: %s — session not logged",
+                self._path, backup, err,
+            )
+            return None
+        return []
+
+    def _free_backup_path(self) -> Path:
+        """Return a timestamped backup path for the xlsx that does not exist."""
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base = f"{self._path.stem}_backup_{stamp}"
+        backup = self._path.with_name(base + self._path.suffix)
+        n = 1
+        while backup.exists():
+            backup = self._path.with_name(f"{base}_{n}{self._path.suffix}")
+            n += 1
+        return backup
+
+    def export_xlsx(self) -> Optional[Path]:
+        """Regenerate the xlsx from the CSV. Returns its path, or None."""
+        if not self._csv_path.exists():
+            return None
+        if Workbook is None:
+            logger.warning("openpyxl not available — monitor kept as CSV only")
+            return None
         try:
-            from openpyxl import Workbook, load_workbook
-
-            if self._path.exists():
-                wb = load_workbook(str(self._path))
-                ws = wb.active
-            else:
-                self._path.parent.mkdir(parents=True, exist_ok=True)
-                wb = Workbook()
-                ws = wb.active
-                ws.title = "Experiment Monitor"
-                ws.append(self.HEADER)
-                for col_idx, header in enumerate(self.HEADER, 1):
-                    ws.column_dimensions[
-                        chr(64 + col_idx) if col_idx <= 26
-                        else "A" + chr(64 + col_idx - 26)
-                    ].width = max(len(header) + 2, 18)
-
-            ws.append([
-                start_time.strftime("%Y-%m-%d"),
-                start_time.strftime("%H:%M:%S"),
-                end_time.strftime("%H:%M:%S"),
-                status,
-                ", ".join(participants),
-                ", ".join(shapes),
-                repetitions,
-                shape_reps_per_subsession,
-                camera_summary,
-                session_folder,
-            ])
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Experiment Monitor")
+            for letter, width in _COL_WIDTHS.items():
+                ws.column_dimensions[letter].width = width
+
+            numeric = [h in self._NUMERIC for h in self.HEADER]
+            with open(self._csv_path, "r", newline="", encoding="utf-8") as f:
+                reader = csv.reader(f)
+                ws.append(next(reader, self.HEADER))
+                for row in reader:
+                    ws.append([
+                        int(v) if num and v.isdigit() else v
+                        for v, num in zip(row, numeric)
+                    ])
 
             wb.save(str(self._path))
-            logger.info("Session logged to %s", self._path)
+            logger.info("Monitor exported to %s", self._path)
+            return self._path
 
-        except ImportError:
-            logger.warning("openpyxl not available — skipping monitor log")
         except Exception as e:
-            logger.error("Failed to log session to monitor: %s", e)
+            logger.error("Failed to export monitor xlsx: %s", e)
+        return None
+
+
+# Column letter -> header width for the xlsx, computed once at import
+_COL_WIDTHS = {
+    get_column_letter(i): max(len(h) + 2, 18)
+    for i, h in enumerate(MainExperimentMonitor.HEADER, 1)
+} if get_column_letter else {}
@@ -3,12 +3,29 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from config.settings import ExperimentConfig
 
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# progress.json is rewritten at most this often; a trailing write is
+# scheduled so the file is never staler than this.
+_PROGRESS_MIN_INTERVAL_S = 0.25
+
 
 class SessionManager:
     """Creates and manages the session output directory tree.
@@ -29,20 +46,38 @@ class SessionManager:
         self.session_dir = (
             Path(config.output_base_dir) / f"session_{self.timestamp}"
         )
+        # (subject, rep, shape) -> (existing folder, cycle filename
+        # template, no-cycle filename template).  Presence implies the
+        # folder has been created, so trial_video_path skips mkdir.
+        self._path_tpl: Dict[Tuple[str, int, str], Tuple[Path, str, str]] = {}
+        # Coalesced crash-recovery progress writes
+        self._progress_lock = threading.Lock()
+        self._pending_progress: Optional[dict] = None
+        self._last_progress_save = 0.0
+        self._progress_timer: Optional[threading.Timer] = None
 
     def create_session_dirs(self, subjects: List[str]) -> Path:
         """Create the full directory hierarchy and return session_dir."""
-        self.session_dir.mkdir(parents=True, exist_ok=True)
-
-        # Subject sub-trees
-        for name in subjects:
-            for rep in range(1, self.config.repetitions + 1):
-                for shape in self.config.shapes:
-                    folder = (
-                        self.session_dir / "subjects" / name
-                        / f"rep_{rep}" / shape
-                    )
-                    folder.mkdir(parents=True, exist_ok=True)
+        subjects_root = self.session_dir / "subjects"
+        subjects_root.mkdir(parents=True, exist_ok=True)
+
+        # Subject sub-trees: dedupe leaves (repeated names/shapes), then
+        # create them concurrently — each mkdir is independent I/O.
+        keys = {
+            (name, rep, shape)
+            for name in subjects
+            for rep in range(1, self.config.repetitions + 1)
+            for shape in self.config.shapes
+        }
+        leaves = sorted(
+            subjects_root / name / f"rep_{rep}" / shape
+            for name, rep, shape in keys
+        )
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            # list() re-raises the first mkdir error, if any
+            list(pool.map(_make_dir, leaves))
+        for key in keys:
+            self._path_tpl[key] = self._build_templates(*key)
 
         # Save config snapshot
         self.config.save(self.session_dir / "session_config.json")
@@ -66,28 +101,82 @@ class SessionManager:
         Generates informative AVI filenames:
             {subject}_{shape}_rep{rep}_shapeRep{inst}_cycle{cycle}_{timestamp}.avi
         """
-        folder = (
-            self.session_dir / "subjects" / subject
-            / f"rep_{rep}" / shape
-        )
-        folder.mkdir(parents=True, exist_ok=True)
+        key = (subject, rep, shape)
+        entry = self._path_tpl.get(key)
+        if entry is None:
+            # e.g. image-mode stimuli, which aren't in config.shapes
+            entry = self._build_templates(subject, rep, shape)
+            entry[0].mkdir(parents=True, exist_ok=True)
+            self._path_tpl[key] = entry
+        folder, tpl_cycle, tpl_plain = entry
         if cycle > 0:
-            filename = (
-                f"{subject}_{shape}_rep{rep}_shapeRep{shape_instance}"
-                f"_cycle{cycle}_{timestamp}.avi"
+            filename = tpl_cycle.format(
+                inst=shape_instance, cycle=cycle, ts=timestamp,
             )
         else:
-            filename = (
-                f"{subject}_{shape}_rep{rep}_shapeRep{shape_instance}_{timestamp}.avi"
-            )
+            filename = tpl_plain.format(inst=shape_instance, ts=timestamp)
         return folder / filename
 
+    def _build_templates(
+        self, subject: str, rep: int, shape: str,
+    ) -> Tuple[Path, str, str]:
+        """Return (folder, cycle template, no-cycle template) for a trial."""
+        folder = (
+            self.session_dir / "subjects" / subject
+            / f"rep_{rep}" / shape
+        )
+        # Fixed fields are baked in; escape braces so str.format only
+        # substitutes inst/cycle/ts.
+        stem = f"{subject}_{shape}_rep{rep}_shapeRep".replace(
+            "{", "{{"
+        ).replace("}", "}}")
+        return (
+            folder,
+            stem + "{inst}_cycle{cycle}_{ts}.avi",
+            stem + "{inst}_{ts}.avi",
+        )
+
     # --- Crash-recovery progress file ---
 
     def save_progress(self, progress: dict) -> None:
+        """Record crash-recovery progress.
+
+        Written immediately unless the last write was less than
+        ``_PROGRESS_MIN_INTERVAL_S`` ago, in which case one trailing
+        write of the latest state is scheduled.  Call
+        ``flush_progress()`` at session end to force it out.
+        """
+        with self._progress_lock:
+            self._pending_progress = progress
+            wait = _PROGRESS_MIN_INTERVAL_S - (
+                time.monotonic() - self._last_progress_save
+            )
+            if wait <= 0:
+                self._write_progress_locked()
+            elif self._progress_timer is None:
+                self._progress_timer = threading.Timer(wait, self.flush_progress)
+                self._progress_timer.daemon = True
+                self._progress_timer.start()
+
+    def flush_progress(self) -> None:
+        """Write any pending progress now."""
+        with self._progress_lock:
+            if self._progress_timer is not None:
+                self._progress_timer.cancel()
+                self._progress_timer = None
+            if self._pending_progress is not None:
+                self._write_progress_locked()
+
+    def _write_progress_locked(self) -> None:
+        """Write progress.json atomically (temp file + rename), compact."""
+        progress = self._pending_progress
+        self._pending_progress = None
+        self._last_progress_save = time.monotonic()
         path = self.session_dir / "progress.json"
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(progress, f, indent=2)
+        tmp = path.with_suffix(".json.tmp")
+        with open(tmp, "wb") as f:
+            f.write(_dumps(progress))
+        os.replace(tmp, path)
 
     def load_progress(self) -> dict | None:
         path = self.session_dir / "progress.json"
@@ -95,3 +184,7 @@ class SessionManager:
             with open(path, "r", encoding="utf-8") as f:
                 return json.load(f)
         return None
+
+
+def _make_dir(folder: Path) -> None:
+    folder.mkdir(parents=True, exist_ok=True)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import logging
 import os
+import subprocess
 import sys
 from pathlib import Path
 
@@ -11,6 +13,8 @@ from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class CompletionDialog(QDialog):
     """Shown after all sessions complete successfully."""
@@ -54,10 +58,15 @@ class CompletionDialog(QDialog):
     def _open_folder(self) -> None:
         """Open the session output folder in the system file manager."""
         path = Path(self._session_dir)
-        if path.exists():
+        if not path.exists():
+            return
+        # No shell and no wait: the launcher returns immediately
+        try:
             if sys.platform == "win32":
                 os.startfile(str(path))
             elif sys.platform == "darwin":
-                os.system(f'open "{path}"')
+                subprocess.Popen(["open", str(path)])
             else:
-                os.system(f'xdg-open "{path}"')
+                subprocess.Popen(["xdg-open", str(path)], start_new_session=True)
+        except OSError as e:
+            logger.warning("Could not open folder %s: %s", path, e)
@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import queue
+import threading
 
-from PyQt5.QtCore import Qt
+import numpy as np
+
+try:
+    import sounddevice as sd
+except ImportError:
+    sd = None
+
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
     QPushButton, QGroupBox, QApplication,
@@ -14,10 +24,36 @@ from data.app_memory import AppMemory
 
 logger = logging.getLogger(__name__)
 
+_TEST_TONE_SR = 44100
+_STOP = object()
+
+
+@functools.lru_cache(maxsize=1)
+def _test_tone():
+    """500ms 440Hz sine with a short fade-out, built once and reused."""
+    duration = 0.5
+    samples = int(_TEST_TONE_SR * duration)
+    # Single float32 buffer: phase -> sine -> gain, all in place
+    tone = np.arange(samples, dtype=np.float32)
+    tone *= np.float32(2 * np.pi * 440 / _TEST_TONE_SR)
+    np.sin(tone, out=tone)
+    tone *= np.float32(0.6)
+    # Apply a short fade-out (last 10% of samples) to avoid clicks;
+    # ramp runs 1.0 -> 0.0 inclusive like linspace(1, 0, fade_len)
+    fade_len = samples // 10
+    ramp = np.arange(fade_len - 1, -1, -1, dtype=np.float32)
+    ramp *= np.float32(1.0 / (fade_len - 1))
+    tone[-fade_len:] *= ramp
+    tone.flags.writeable = False
+    return tone
+
 
 class DisplayAudioDialog(QDialog):
     """Wizard step 4: select display screen and audio output device."""
 
+    # Emitted from the audio worker thread; delivered queued on the GUI thread
+    _speaker_error = pyqtSignal(str)
+
     def __init__(self, memory: AppMemory, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Display & Audio")
@@ -25,8 +61,27 @@ class DisplayAudioDialog(QDialog):
         self._memory = memory
         self._selected_screen = 0
         self._selected_device = ""
+        self._device_index_by_name = {}
+        # Speaker tests run on one long-lived worker that keeps an
+        # OutputStream open per device, started on the first press.
+        self._audio_q: queue.Queue = queue.Queue()
+        self._audio_thread = None
+        self._speaker_error.connect(self._show_speaker_error)
+        # (screen, name, geometry) per screen, queried once; refreshed
+        # only if the monitor set changes while the dialog is open.
+        self._screens_info = []
+        self._refresh_screens()
+        app = QApplication.instance()
+        app.screenAdded.connect(self._refresh_screens)
+        app.screenRemoved.connect(self._refresh_screens)
         self._build_ui()
 
+    def _refresh_screens(self, *_args) -> None:
+        self._screens_info = [
+            (s, s.name(), s.geometry())
+            for s in QApplication.instance().screens()
+        ]
+
     def _build_ui(self) -> None:
         layout = QVBoxLayout()
 
@@ -35,13 +90,12 @@ class DisplayAudioDialog(QDialog):
         screen_layout = QVBoxLayout()
 
         self._screen_combo = QComboBox()
-        app = QApplication.instance()
-        screens = app.screens()
-        for i, screen in enumerate(screens):
-            geo = screen.geometry()
-            primary = " (Primary)" if screen == app.primaryScreen() else ""
+        screens = self._screens_info
+        primary_screen = QApplication.instance().primaryScreen()
+        for i, (screen, name, geo) in enumerate(screens):
+            primary = " (Primary)" if screen == primary_screen else ""
             self._screen_combo.addItem(
-                f"Screen {i + 1}: {screen.name()} "
+                f"Screen {i + 1}: {name} "
                 f"({geo.width()}x{geo.height()}){primary}",
                 i,
             )
@@ -98,8 +152,13 @@ class DisplayAudioDialog(QDialog):
         """Fill the speaker combo with available output devices."""
         self._speaker_combo.addItem("System Default", "")
         try:
-            from audio import list_audio_devices
+            from audio import (
+                list_audio_devices, output_device_indices, refresh_audio_devices,
+            )
+            # Re-enumerate so a speaker plugged in since the last query shows up
+            refresh_audio_devices()
             devices = list_audio_devices()
+            self._device_index_by_name = output_device_indices()
             for name in devices:
                 self._speaker_combo.addItem(name, name)
             # Restore last used device
@@ -114,11 +173,9 @@ class DisplayAudioDialog(QDialog):
         """Briefly flash white on the selected screen."""
         screen_idx = self._screen_combo.currentData()
         try:
-            app = QApplication.instance()
-            screens = app.screens()
+            screens = self._screens_info
             if screen_idx < len(screens):
-                screen = screens[screen_idx]
-                geo = screen.geometry()
+                geo = screens[screen_idx][2]
 
                 from PyQt5.QtWidgets import QWidget
                 from PyQt5.QtCore import QTimer
@@ -151,50 +208,70 @@ class DisplayAudioDialog(QDialog):
 
         Uses sounddevice directly instead of PsychoPy AudioManager to avoid
         crashes when the configured audio device is unavailable.
-        Runs in a background thread so the Qt event loop is never blocked.
+        Playback happens on a background worker so the Qt event loop is
+        never blocked.
         """
-        import threading
         device_name = self._speaker_combo.currentData()
+        device_idx = self._device_index_by_name.get(device_name) if device_name else None
+        if self._audio_thread is None:
+            self._audio_thread = threading.Thread(
+                target=self._audio_worker, name="SpeakerTest", daemon=True,
+            )
+            self._audio_thread.start()
+        self._audio_q.put(device_idx)
 
-        def _play():
-            try:
-                import sounddevice as sd
-                import numpy as np
-
-                # Find device index by name
-                device_idx = None
-                if device_name:
-                    for i, d in enumerate(sd.query_devices()):
-                        if d['name'] == device_name and d['max_output_channels'] > 0:
-                            device_idx = i
-                            break
-
-                # Generate 500ms 440Hz sine tone with a short fade-out
-                sr = 44100
-                duration = 0.5
-                samples = int(sr * duration)
-                t = np.linspace(0, duration, samples, False)
-                tone = (0.6 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
-                # Apply a short fade-out (last 10% of samples) to avoid clicks
-                fade_len = samples // 10
-                tone[-fade_len:] *= np.linspace(1.0, 0.0, fade_len, dtype=np.float32)
-                sd.play(tone, sr, device=device_idx)
-                sd.wait()
-            except Exception as e:
-                logger.warning("Speaker test failed: %s", e)
-                from PyQt5.QtCore import QMetaObject, Qt
-                from PyQt5.QtWidgets import QMessageBox
-                # Show the error on the main thread
-                QMetaObject.invokeMethod(
-                    self,
-                    "_show_speaker_error",
-                    Qt.QueuedConnection,
-                    *[str(e)],  # type: ignore[arg-type]
-                )
-
-        threading.Thread(target=_play, daemon=True).start()
-
-    def _show_speaker_error(self, msg: str) -> None:  # called from worker thread via invokeMethod
+    def _audio_worker(self) -> None:
+        """Play queued test beeps, reusing one open stream per device."""
+        streams = {}
+        try:
+            while True:
+                device_idx = self._audio_q.get()
+                if device_idx is _STOP:
+                    break
+                try:
+                    stream = streams.get(device_idx)
+                    if stream is None:
+                        if sd is None:
+                            raise RuntimeError("sounddevice is not installed")
+                        stream = sd.OutputStream(
+                            samplerate=_TEST_TONE_SR, channels=1,
+                            dtype="float32", device=device_idx,
+                        )
+                        stream.start()
+                        streams[device_idx] = stream
+                    stream.write(_test_tone())
+                except Exception as e:
+                    logger.warning("Speaker test failed: %s", e)
+                    # Drop a broken stream so the next press reopens it
+                    broken = streams.pop(device_idx, None)
+                    if broken is not None:
+                        try:
+                            broken.close()
+                        except Exception:
+                            pass
+                    self._speaker_error.emit(str(e))
+        finally:
+            for stream in streams.values():
+                try:
+                    stream.close()
+                except Exception:
+                    pass
+
+    def _stop_audio_worker(self) -> None:
+        if self._audio_thread is not None:
+            self._audio_q.put(_STOP)
+            self._audio_thread.join(timeout=2.0)
+            self._audio_thread = None
+
+    def done(self, result: int) -> None:
+        self._stop_audio_worker()
+        super().done(result)
+
+    def closeEvent(self, event) -> None:
+        self._stop_audio_worker()
+        super().closeEvent(event)
+
+    def _show_speaker_error(self, msg: str) -> None:
         from PyQt5.QtWidgets import QMessageBox
         QMessageBox.warning(self, "Speaker Test Failed", f"Could not play test beep:\n{msg}")
 
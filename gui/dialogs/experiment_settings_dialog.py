@@ -2,55 +2,124 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QColor
+from PyQt5.QtCore import Qt, QTimer, QStringListModel
+from PyQt5.QtGui import QColor, QFont, QPainter, QPixmap
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox,
     QSpinBox, QDoubleSpinBox, QCheckBox, QPushButton, QLabel,
-    QFileDialog, QLineEdit, QToolButton, QMessageBox, QColorDialog,
-    QListWidget, QListWidgetItem, QRadioButton, QButtonGroup,
+    QFileDialog, QLineEdit, QMessageBox, QColorDialog,
+    QListView, QRadioButton, QButtonGroup, QAbstractItemView,
     QScrollArea, QWidget,
 )
 
 from config.settings import ExperimentConfig
 from data.app_memory import AppMemory
 
+_DEFAULTS_PATH = Path(__file__).resolve().parent.parent.parent / "config" / "defaults.json"
 
-def _tooltip_btn(tooltip: str) -> QToolButton:
-    """Create a small '?' button that shows an info popup on click."""
-    btn = QToolButton()
-    btn.setText("?")
-    btn.setFixedSize(22, 22)
-    btn.setToolTip(tooltip)
-    btn.setStyleSheet(
-        "font-size: 11px; font-weight: bold; "
-        "border: 1px solid #666; border-radius: 11px; "
-        "background-color: #e0e0e0; color: #333;"
-    )
-    btn.setCursor(Qt.PointingHandCursor)
-    # Show a popup dialog on click
-    btn.clicked.connect(lambda checked, msg=tooltip: QMessageBox.information(
-        btn.window(), "Info", msg,
-    ))
-    return btn
+
+@lru_cache(maxsize=64)
+def _color_qss(hex_name: str) -> str:
+    return f"background-color: {hex_name}; border: 1px solid #666;"
+
+
+class _InfoLabel(QLabel):
+    """Small '?' badge that shows an info popup on click.
+
+    All instances share one pre-rendered pixmap instead of each carrying
+    its own stylesheet (as a QToolButton did).
+    """
+
+    _PIX: Optional[QPixmap] = None
+    _SIZE = 22
+
+    def __init__(self, tooltip: str, parent=None):
+        super().__init__(parent)
+        self._msg = tooltip
+        self.setPixmap(self._pixmap())
+        self.setFixedSize(self._SIZE, self._SIZE)
+        self.setToolTip(tooltip)
+        self.setCursor(Qt.PointingHandCursor)
+
+    @classmethod
+    def _pixmap(cls) -> QPixmap:
+        # Built on first use: QPixmap needs a running QApplication
+        if cls._PIX is None:
+            n = cls._SIZE
+            pix = QPixmap(n, n)
+            pix.fill(Qt.transparent)
+            p = QPainter(pix)
+            p.setRenderHint(QPainter.Antialiasing)
+            p.setPen(QColor("#666"))
+            p.setBrush(QColor("#e0e0e0"))
+            p.drawEllipse(0, 0, n - 1, n - 1)
+            font = QFont()
+            font.setPixelSize(11)
+            font.setBold(True)
+            p.setFont(font)
+            p.setPen(QColor("#333"))
+            p.drawText(pix.rect(), Qt.AlignCenter, "?")
+            p.end()
+            cls._PIX = pix
+        return cls._PIX
+
+    def mousePressEvent(self, event) -> None:
+        if event.button() == Qt.LeftButton:
+            QMessageBox.information(self.window(), "Info", self._msg)
+        else:
+            super().mousePressEvent(event)
 
 
 def _row_with_tooltip(widget, tooltip: str):
-    """Wrap a widget with a '?' tooltip button."""
+    """Wrap a widget with a '?' info badge."""
     row = QHBoxLayout()
     row.addWidget(widget, stretch=1)
-    row.addWidget(_tooltip_btn(tooltip))
+    row.addWidget(_InfoLabel(tooltip))
     return row
 
 
+def _add_spin_rows(owner, form: QFormLayout, specs) -> None:
+    """Create spin boxes from spec tuples, set them on *owner*, add form rows.
+
+    Each spec is ``(attr, label, low, high, decimals, suffix, value,
+    tooltip)``; ``decimals=None`` builds a QSpinBox, otherwise a
+    QDoubleSpinBox.
+    """
+    for attr, label, low, high, decimals, suffix, value, tooltip in specs:
+        if decimals is None:
+            w = QSpinBox()
+        else:
+            w = QDoubleSpinBox()
+            w.setDecimals(decimals)
+        w.setRange(low, high)
+        if suffix:
+            w.setSuffix(suffix)
+        w.setValue(value)
+        setattr(owner, attr, w)
+        form.addRow(label, _row_with_tooltip(w, tooltip))
+
+
 class ExperimentSettingsDialog(QDialog):
     """Wizard step 2: experiment settings (shapes, reps, timing, output)."""
 
     SHAPE_OPTIONS = ["circle", "square", "triangle", "star"]
 
+    # Assume 60 Hz display for stop-flip overhead in the estimate
+    _FRAME_DUR = 1.0 / 60.0
+    # Cached estimate sub-sums and the widgets each one depends on
+    _DUR_DEPS = {
+        "training_phase": (
+            "_train_reps", "_train_shape_dur", "_train_blank_dur", "_end_beep_dur",
+        ),
+        "measurement_phase": (
+            "_imagination_cycles", "_imagination_dur", "_end_beep_dur", "_inter_delay",
+        ),
+    }
+
     def __init__(self, config: ExperimentConfig, memory: AppMemory,
                  parent=None, n_subjects: int = 0):
         super().__init__(parent)
@@ -61,7 +130,15 @@ class ExperimentSettingsDialog(QDialog):
         self._n_subjects = n_subjects
         self._shape_checks: dict[str, QCheckBox] = {}
         self._selected_color = QColor(config.stimulus.color_hex)
+        self._last_applied_color: Optional[str] = None
+        # Config dict last written by "Save as Default"
+        self._saved_defaults: Optional[dict] = None
         self._image_paths: List[str] = list(config.stimulus.image_paths)
+        # Membership index for _image_paths (which keeps display order)
+        self._image_paths_set = set(self._image_paths)
+        # Memory values for widgets whose group has not been built yet
+        self._pending_values: dict[str, float] = {}
+        self._dur_cache: dict[str, float] = {}
         self._build_ui()
         self._load_from_memory()
 
@@ -117,7 +194,7 @@ class ExperimentSettingsDialog(QDialog):
         self._color_btn = QPushButton("Choose Color...")
         self._color_btn.clicked.connect(self._pick_color)
         color_row.addWidget(self._color_btn)
-        color_row.addWidget(_tooltip_btn(
+        color_row.addWidget(_InfoLabel(
             "Pick the exact color for shape stimuli. Default: white (#FFFFFF). "
             "Adjusting this also controls brightness (darker = dimmer)."))
         color_row.addStretch()
@@ -131,10 +208,13 @@ class ExperimentSettingsDialog(QDialog):
         images_inner = QVBoxLayout()
         images_inner.setContentsMargins(0, 0, 0, 0)
 
-        self._image_list = QListWidget()
+        # File names shown via one model; the list is replaced wholesale
+        self._image_list_model = QStringListModel(self)
+        self._image_list = QListView()
+        self._image_list.setModel(self._image_list_model)
+        self._image_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self._image_list.setMaximumHeight(100)
-        for path in self._image_paths:
-            self._image_list.addItem(Path(path).name)
+        self._refresh_image_list()
         images_inner.addWidget(self._image_list)
 
         img_btn_row = QHBoxLayout()
@@ -144,7 +224,7 @@ class ExperimentSettingsDialog(QDialog):
         remove_img_btn = QPushButton("Remove Selected")
         remove_img_btn.clicked.connect(self._remove_image)
         img_btn_row.addWidget(remove_img_btn)
-        img_btn_row.addWidget(_tooltip_btn(
+        img_btn_row.addWidget(_InfoLabel(
             "Add image files (PNG, JPG, BMP, GIF, TIFF) to use as stimuli "
             "instead of shapes. Each image is presented in sequence like shapes."))
         img_btn_row.addStretch()
@@ -162,145 +242,46 @@ class ExperimentSettingsDialog(QDialog):
 
         # ── Repetitions and timing ──
         form = QFormLayout()
-
-        self._reps = QSpinBox()
-        self._reps.setRange(1, 50)
-        self._reps.setValue(self._config.repetitions)
-        form.addRow("Repetitions:", _row_with_tooltip(
-            self._reps, "Number of complete rounds for each subject"))
-
-        self._shape_reps = QSpinBox()
-        self._shape_reps.setRange(1, 10)
-        self._shape_reps.setValue(self._config.shape_reps_per_subsession)
-        form.addRow("Shape reps per sub-session:", _row_with_tooltip(
-            self._shape_reps,
-            "How many times each shape repeats within one sub-session "
-            "before moving to next participant. Default 1 = each shape once."))
-
         t = self._config.timing
-
-        self._train_shape_dur = QDoubleSpinBox()
-        self._train_shape_dur.setRange(0.1, 10.0)
-        self._train_shape_dur.setDecimals(1)
-        self._train_shape_dur.setSuffix(" s")
-        self._train_shape_dur.setValue(t.training_shape_duration)
-        form.addRow("Training shape:", _row_with_tooltip(
-            self._train_shape_dur,
-            "How long the shape is displayed with the beep"))
-
-        self._train_blank_dur = QDoubleSpinBox()
-        self._train_blank_dur.setRange(0.1, 10.0)
-        self._train_blank_dur.setDecimals(1)
-        self._train_blank_dur.setSuffix(" s")
-        self._train_blank_dur.setValue(t.training_blank_duration)
-        form.addRow("Training blank:", _row_with_tooltip(
-            self._train_blank_dur,
-            "Silent gap between shape flashes"))
-
-        self._train_reps = QSpinBox()
-        self._train_reps.setRange(1, 20)
-        self._train_reps.setValue(t.training_repetitions)
-        form.addRow("Training flashes:", _row_with_tooltip(
-            self._train_reps,
-            "Number of shape+beep presentations per training phase"))
-
-        self._train_to_meas_delay = QDoubleSpinBox()
-        self._train_to_meas_delay.setRange(0.0, 60.0)
-        self._train_to_meas_delay.setDecimals(1)
-        self._train_to_meas_delay.setSuffix(" s")
-        self._train_to_meas_delay.setValue(t.training_to_measurement_delay)
-        form.addRow("Training→Measurement delay:", _row_with_tooltip(
-            self._train_to_meas_delay,
-            "Extra delay (seconds) between the training phase and the "
-            "measurement phase. 0 = no extra delay (default)."))
-
+        # (attr, label, low, high, decimals (None = int), suffix, value, tooltip)
+        _add_spin_rows(self, form, (
+            ("_reps", "Repetitions:", 1, 50, None, "",
+             self._config.repetitions,
+             "Number of complete rounds for each subject"),
+            ("_shape_reps", "Shape reps per sub-session:", 1, 10, None, "",
+             self._config.shape_reps_per_subsession,
+             "How many times each shape repeats within one sub-session "
+             "before moving to next participant. Default 1 = each shape once."),
+            ("_train_shape_dur", "Training shape:", 0.1, 10.0, 1, " s",
+             t.training_shape_duration,
+             "How long the shape is displayed with the beep"),
+            ("_train_blank_dur", "Training blank:", 0.1, 10.0, 1, " s",
+             t.training_blank_duration,
+             "Silent gap between shape flashes"),
+            ("_train_reps", "Training flashes:", 1, 20, None, "",
+             t.training_repetitions,
+             "Number of shape+beep presentations per training phase"),
+            ("_train_to_meas_delay", "Training→Measurement delay:", 0.0, 60.0, 1, " s",
+             t.training_to_measurement_delay,
+             "Extra delay (seconds) between the training phase and the "
+             "measurement phase. 0 = no extra delay (default)."),
+        ))
         layout.addLayout(form)
 
-        # ── Imagination Settings ──
-        imag_group = QGroupBox("Imagination Settings")
-        imag_form = QFormLayout()
-
-        a = self._config.audio
-
-        self._start_beep_freq = QDoubleSpinBox()
-        self._start_beep_freq.setRange(100.0, 5000.0)
-        self._start_beep_freq.setDecimals(0)
-        self._start_beep_freq.setSuffix(" Hz")
-        self._start_beep_freq.setValue(a.start_imagine_frequency)
-        imag_form.addRow("Start beep freq:", _row_with_tooltip(
-            self._start_beep_freq,
-            "Frequency of the 'start imagining' beep (must differ from "
-            "440 Hz training tone)"))
-
-        self._start_beep_dur = QDoubleSpinBox()
-        self._start_beep_dur.setRange(0.05, 2.0)
-        self._start_beep_dur.setDecimals(2)
-        self._start_beep_dur.setSuffix(" s")
-        self._start_beep_dur.setValue(a.start_imagine_duration)
-        imag_form.addRow("Start beep duration:", _row_with_tooltip(
-            self._start_beep_dur,
-            "Duration of the 'start imagining' beep"))
-
-        self._end_beep_freq = QDoubleSpinBox()
-        self._end_beep_freq.setRange(100.0, 5000.0)
-        self._end_beep_freq.setDecimals(0)
-        self._end_beep_freq.setSuffix(" Hz")
-        self._end_beep_freq.setValue(a.end_imagine_frequency)
-        imag_form.addRow("End beep freq:", _row_with_tooltip(
-            self._end_beep_freq,
-            "Frequency of the 'end imagining' beep (must differ from "
-            "start beep frequency)"))
-
-        self._end_beep_dur = QDoubleSpinBox()
-        self._end_beep_dur.setRange(0.05, 2.0)
-        self._end_beep_dur.setDecimals(2)
-        self._end_beep_dur.setSuffix(" s")
-        self._end_beep_dur.setValue(a.end_imagine_duration)
-        imag_form.addRow("End beep duration:", _row_with_tooltip(
-            self._end_beep_dur,
-            "Duration of the 'end imagining' beep"))
-
-        self._imagination_dur = QDoubleSpinBox()
-        self._imagination_dur.setRange(1.0, 120.0)
-        self._imagination_dur.setDecimals(1)
-        self._imagination_dur.setSuffix(" s")
-        self._imagination_dur.setValue(t.imagination_duration)
-        imag_form.addRow("Imagination duration:", _row_with_tooltip(
-            self._imagination_dur,
-            "Total time from start beep onset to end beep onset. "
-            "Camera records for: imagination_duration − start_beep − 1s delay."))
-
-        self._inter_delay = QDoubleSpinBox()
-        self._inter_delay.setRange(0.0, 30.0)
-        self._inter_delay.setDecimals(1)
-        self._inter_delay.setSuffix(" s")
-        self._inter_delay.setValue(t.inter_imagination_delay)
-        imag_form.addRow("Inter-imagination delay:", _row_with_tooltip(
-            self._inter_delay,
-            "Delay between end of one imagination cycle and start of "
-            "the next start beep"))
-
-        self._imagination_cycles = QSpinBox()
-        self._imagination_cycles.setRange(1, 20)
-        self._imagination_cycles.setValue(t.imagination_cycles)
-        imag_form.addRow("Imagination cycles:", _row_with_tooltip(
-            self._imagination_cycles,
-            "Number of imagination cycles per measurement phase. "
-            "Each cycle produces one video recording."))
-
-        imag_group.setLayout(imag_form)
-        layout.addWidget(imag_group)
-
-        # Output folder
-        folder_group = QGroupBox("Output Folder")
-        folder_layout = QHBoxLayout()
-        self._folder_edit = QLineEdit(self._config.output_base_dir)
-        folder_layout.addWidget(self._folder_edit)
-        browse_btn = QPushButton("Browse...")
-        browse_btn.clicked.connect(self._browse_folder)
-        folder_layout.addWidget(browse_btn)
-        folder_group.setLayout(folder_layout)
-        layout.addWidget(folder_group)
+        # ── Imagination Settings / Output folder ──
+        # Built lazily: placeholders hold their place until they scroll
+        # into view (or the values are needed), see _maybe_realize().
+        self._layout = layout
+        self._placeholders: dict[str, QWidget] = {}
+        for key, height in (("imag", 260), ("folder", 70)):
+            ph = QWidget()
+            ph.setMinimumHeight(height)
+            self._placeholders[key] = ph
+            layout.addWidget(ph)
+        scroll.verticalScrollBar().valueChanged.connect(self._maybe_realize)
+        # A resize or relayout can bring a placeholder into view without
+        # moving the scrollbar
+        scroll.verticalScrollBar().rangeChanged.connect(self._schedule_realize)
 
         content.setLayout(layout)
         scroll.setWidget(content)
@@ -318,6 +299,10 @@ class ExperimentSettingsDialog(QDialog):
         duration_btn.clicked.connect(self._show_estimated_duration)
         btn_layout.addWidget(duration_btn)
 
+        self._estimate_label = QLabel("")
+        self._estimate_label.setStyleSheet("color: #666;")
+        btn_layout.addWidget(self._estimate_label)
+
         btn_layout.addStretch()
 
         next_btn = QPushButton("Next")
@@ -328,6 +313,116 @@ class ExperimentSettingsDialog(QDialog):
         outer.addLayout(btn_layout)
         self.setLayout(outer)
 
+        self._train_to_meas_delay.valueChanged.connect(self._refresh_estimate_label)
+        self._wire_duration_deps(
+            "_train_reps", "_train_shape_dur", "_train_blank_dur",
+        )
+
+    # ── Deferred groups ──
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        # Realize whatever is on screen once the first paint is queued
+        self._schedule_realize()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._schedule_realize()
+
+    def _schedule_realize(self, *_args) -> None:
+        """Run _maybe_realize() once the pending geometry has settled."""
+        if self._placeholders:
+            QTimer.singleShot(0, self._maybe_realize)
+
+    def _maybe_realize(self, *_args) -> None:
+        """Build any deferred group whose placeholder is now visible."""
+        for key, ph in list(self._placeholders.items()):
+            if not ph.visibleRegion().isEmpty():
+                self._realize(key)
+
+    def _force_build_all(self) -> None:
+        for key in list(self._placeholders):
+            self._realize(key)
+
+    def _realize(self, key: str) -> None:
+        ph = self._placeholders.pop(key, None)
+        if ph is None:
+            return
+        if key == "imag":
+            group = self._build_imag_group()
+            for name, value in self._pending_values.items():
+                getattr(self, name).setValue(value)
+            self._pending_values.clear()
+            self._wire_duration_deps(
+                "_end_beep_dur", "_imagination_dur",
+                "_imagination_cycles", "_inter_delay",
+            )
+        else:
+            group = self._build_folder_group()
+        self._layout.replaceWidget(ph, group)
+        ph.deleteLater()
+        if key == "imag":
+            self._dur_cache.clear()
+            self._refresh_estimate_label()
+
+    def _set_deferred(self, name: str, value) -> None:
+        """setValue on a deferred-group spin box, or stash it until built."""
+        if "imag" in self._placeholders:
+            self._pending_values[name] = value
+        else:
+            getattr(self, name).setValue(value)
+
+    def _build_imag_group(self) -> QGroupBox:
+        imag_group = QGroupBox("Imagination Settings")
+        imag_form = QFormLayout()
+
+        a = self._config.audio
+        t = self._config.timing
+        _add_spin_rows(self, imag_form, (
+            ("_start_beep_freq", "Start beep freq:", 100.0, 5000.0, 0, " Hz",
+             a.start_imagine_frequency,
+             "Frequency of the 'start imagining' beep (must differ from "
+             "440 Hz training tone)"),
+            ("_start_beep_dur", "Start beep duration:", 0.05, 2.0, 2, " s",
+             a.start_imagine_duration,
+             "Duration of the 'start imagining' beep"),
+            ("_end_beep_freq", "End beep freq:", 100.0, 5000.0, 0, " Hz",
+             a.end_imagine_frequency,
+             "Frequency of the 'end imagining' beep (must differ from "
+             "start beep frequency)"),
+            ("_end_beep_dur", "End beep duration:", 0.05, 2.0, 2, " s",
+             a.end_imagine_duration,
+             "Duration of the 'end imagining' beep"),
+            ("_imagination_dur", "Imagination duration:", 1.0, 120.0, 1, " s",
+             t.imagination_duration,
+             "Total time from start beep onset to end beep onset. "
+             "Camera records for: imagination_duration − start_beep − 1s delay."),
+            ("_inter_delay", "Inter-imagination delay:", 0.0, 30.0, 1, " s",
+             t.inter_imagination_delay,
+             "Delay between end of one imagination cycle and start of "
+             "the next start beep"),
+            ("_imagination_cycles", "Imagination cycles:", 1, 20, None, "",
+             t.imagination_cycles,
+             "Number of imagination cycles per measurement phase. "
+             "Each cycle produces one video recording."),
+        ))
+
+        imag_group.setLayout(imag_form)
+        return imag_group
+
+    def _build_folder_group(self) -> QGroupBox:
+        folder_group = QGroupBox("Output Folder")
+        folder_layout = QHBoxLayout()
+        self._folder_edit = QLineEdit(
+            self._memory.last_output_folder or self._config.output_base_dir
+        )
+        folder_layout.addWidget(self._folder_edit)
+        browse_btn = QPushButton("Browse...")
+        browse_btn.clicked.connect(self._browse_folder)
+        folder_layout.addWidget(browse_btn)
+        folder_group.setLayout(folder_layout)
+        return folder_group
+
     # ── Stimulus mode helpers ──
 
     def _on_stim_mode_changed(self, shapes_checked: bool) -> None:
@@ -335,16 +430,18 @@ class ExperimentSettingsDialog(QDialog):
         self._images_widget.setVisible(not shapes_checked)
 
     def _update_color_preview(self) -> None:
-        self._color_preview.setStyleSheet(
-            f"background-color: {self._selected_color.name()}; "
-            f"border: 1px solid #666;"
-        )
+        name = self._selected_color.name()
+        # setStyleSheet re-parses the QSS; skip it when nothing changed
+        if name == self._last_applied_color:
+            return
+        self._color_preview.setStyleSheet(_color_qss(name))
+        self._last_applied_color = name
 
     def _pick_color(self) -> None:
         color = QColorDialog.getColor(
             self._selected_color, self, "Choose Shape Color"
         )
-        if color.isValid():
+        if color.isValid() and color != self._selected_color:
             self._selected_color = color
             self._update_color_preview()
 
@@ -353,70 +450,103 @@ class ExperimentSettingsDialog(QDialog):
             self, "Select Stimulus Image(s)", "",
             "Images (*.png *.jpg *.jpeg *.bmp *.gif *.tiff *.tif)"
         )
+        new = []
         for p in paths:
-            if p not in self._image_paths:
-                self._image_paths.append(p)
-                self._image_list.addItem(Path(p).name)
+            if p not in self._image_paths_set:
+                self._image_paths_set.add(p)
+                new.append(p)
+        if new:
+            self._image_paths.extend(new)
+            self._refresh_image_list()
 
     def _remove_image(self) -> None:
-        row = self._image_list.currentRow()
+        row = self._image_list.currentIndex().row()
         if row >= 0:
-            self._image_paths.pop(row)
-            self._image_list.takeItem(row)
+            self._image_paths_set.discard(self._image_paths.pop(row))
+            self._image_list_model.removeRows(row, 1)
+
+    def _refresh_image_list(self) -> None:
+        self._image_list_model.setStringList(
+            [Path(p).name for p in self._image_paths]
+        )
 
     def _load_from_memory(self) -> None:
-        """Pre-populate from AppMemory if available."""
-        if self._memory.last_output_folder:
-            self._folder_edit.setText(self._memory.last_output_folder)
-        if self._memory.last_settings:
-            ls = self._memory.last_settings
-            # Shapes
-            if "shapes" in ls:
-                for name, cb in self._shape_checks.items():
-                    cb.setChecked(name in ls["shapes"])
-            # Repetitions
-            if "repetitions" in ls:
-                self._reps.setValue(ls["repetitions"])
-            if "shape_reps_per_subsession" in ls:
-                self._shape_reps.setValue(ls["shape_reps_per_subsession"])
-            # Timing
-            timing = ls.get("timing", {})
-            if "training_shape_duration" in timing:
-                self._train_shape_dur.setValue(timing["training_shape_duration"])
-            if "training_blank_duration" in timing:
-                self._train_blank_dur.setValue(timing["training_blank_duration"])
-            if "training_repetitions" in timing:
-                self._train_reps.setValue(timing["training_repetitions"])
-            if "training_to_measurement_delay" in timing:
-                self._train_to_meas_delay.setValue(timing["training_to_measurement_delay"])
-            if "imagination_duration" in timing:
-                self._imagination_dur.setValue(timing["imagination_duration"])
-            if "imagination_cycles" in timing:
-                self._imagination_cycles.setValue(timing["imagination_cycles"])
-            if "inter_imagination_delay" in timing:
-                self._inter_delay.setValue(timing["inter_imagination_delay"])
-            # Audio imagination settings
-            audio = ls.get("audio", {})
-            if "start_imagine_frequency" in audio:
-                self._start_beep_freq.setValue(audio["start_imagine_frequency"])
-            if "start_imagine_duration" in audio:
-                self._start_beep_dur.setValue(audio["start_imagine_duration"])
-            if "end_imagine_frequency" in audio:
-                self._end_beep_freq.setValue(audio["end_imagine_frequency"])
-            if "end_imagine_duration" in audio:
-                self._end_beep_dur.setValue(audio["end_imagine_duration"])
-            # Stimulus settings
-            stim = ls.get("stimulus", {})
-            if "color_hex" in stim:
-                self._selected_color = QColor(stim["color_hex"])
-                self._update_color_preview()
-            if "use_images" in stim and stim["use_images"]:
-                self._radio_images.setChecked(True)
-            if "image_paths" in stim and stim["image_paths"]:
-                self._image_paths = list(stim["image_paths"])
-                self._image_list.clear()
-                for p in self._image_paths:
-                    self._image_list.addItem(Path(p).name)
+        """Pre-populate from AppMemory if available.
+
+        The bulk update runs with widget signals blocked and repaints
+        suspended, so the dialog lays out and paints once at the end.
+        """
+        # last_output_folder is applied when the folder group is built
+        if not self._memory.last_settings:
+            return
+        # Radio buttons stay unblocked: their toggled signal drives the
+        # shapes/images panel visibility.
+        widgets = [
+            *self._shape_checks.values(),
+            self._reps, self._shape_reps,
+            self._train_shape_dur, self._train_blank_dur,
+            self._train_reps, self._train_to_meas_delay,
+        ]
+        for w in widgets:
+            w.blockSignals(True)
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply_last_settings(self._memory.last_settings)
+        finally:
+            for w in widgets:
+                w.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.update()
+            # Blocked signals skipped invalidation
+            self._dur_cache.clear()
+
+    def _apply_last_settings(self, ls: dict) -> None:
+        # Shapes
+        if "shapes" in ls:
+            for name, cb in self._shape_checks.items():
+                cb.setChecked(name in ls["shapes"])
+        # Repetitions
+        if "repetitions" in ls:
+            self._reps.setValue(ls["repetitions"])
+        if "shape_reps_per_subsession" in ls:
+            self._shape_reps.setValue(ls["shape_reps_per_subsession"])
+        # Timing
+        timing = ls.get("timing", {})
+        if "training_shape_duration" in timing:
+            self._train_shape_dur.setValue(timing["training_shape_duration"])
+        if "training_blank_duration" in timing:
+            self._train_blank_dur.setValue(timing["training_blank_duration"])
+        if "training_repetitions" in timing:
+            self._train_reps.setValue(timing["training_repetitions"])
+        if "training_to_measurement_delay" in timing:
+            self._train_to_meas_delay.setValue(timing["training_to_measurement_delay"])
+        if "imagination_duration" in timing:
+            self._set_deferred("_imagination_dur", timing["imagination_duration"])
+        if "imagination_cycles" in timing:
+            self._set_deferred("_imagination_cycles", timing["imagination_cycles"])
+        if "inter_imagination_delay" in timing:
+            self._set_deferred("_inter_delay", timing["inter_imagination_delay"])
+        # Audio imagination settings
+        audio = ls.get("audio", {})
+        if "start_imagine_frequency" in audio:
+            self._set_deferred("_start_beep_freq", audio["start_imagine_frequency"])
+        if "start_imagine_duration" in audio:
+            self._set_deferred("_start_beep_dur", audio["start_imagine_duration"])
+        if "end_imagine_frequency" in audio:
+            self._set_deferred("_end_beep_freq", audio["end_imagine_frequency"])
+        if "end_imagine_duration" in audio:
+            self._set_deferred("_end_beep_dur", audio["end_imagine_duration"])
+        # Stimulus settings
+        stim = ls.get("stimulus", {})
+        if "color_hex" in stim:
+            self._selected_color = QColor(stim["color_hex"])
+            self._update_color_preview()
+        if "use_images" in stim and stim["use_images"]:
+            self._radio_images.setChecked(True)
+        if "image_paths" in stim and stim["image_paths"]:
+            self._image_paths = list(stim["image_paths"])
+            self._image_paths_set = set(self._image_paths)
+            self._refresh_image_list()
 
     def _browse_folder(self) -> None:
         folder = QFileDialog.getExistingDirectory(
@@ -425,48 +555,75 @@ class ExperimentSettingsDialog(QDialog):
         if folder:
             self._folder_edit.setText(folder)
 
+    # ── Duration estimate ──
+
+    def _wire_duration_deps(self, *names: str) -> None:
+        """Invalidate the cached sub-sums that depend on these widgets."""
+        for name in names:
+            keys = tuple(k for k, deps in self._DUR_DEPS.items() if name in deps)
+            getattr(self, name).valueChanged.connect(
+                lambda *_, keys=keys: self._invalidate_duration(keys)
+            )
+
+    def _invalidate_duration(self, keys) -> None:
+        for key in keys:
+            self._dur_cache.pop(key, None)
+        self._refresh_estimate_label()
+
+    def _phase_duration(self, key: str) -> float:
+        """Cached training/measurement phase length in seconds."""
+        value = self._dur_cache.get(key)
+        if value is None:
+            frame_dur = self._FRAME_DUR
+            end_beep_dur = self._end_beep_dur.value()
+            if key == "training_phase":
+                # Training: shape + end_beep + blank + 1 stop flip per rep
+                value = self._train_reps.value() * (
+                    self._train_shape_dur.value() + end_beep_dur
+                    + self._train_blank_dur.value() + frame_dur
+                )
+            else:
+                # Measurement per cycle: imagination_dur + end_beep + 2 stop
+                # flips + camera start/stop overhead (~50ms per cycle)
+                camera_overhead = 0.05
+                imag_cycles = self._imagination_cycles.value()
+                value = (
+                    imag_cycles * (self._imagination_dur.value() + end_beep_dur
+                                   + 2 * frame_dur + camera_overhead)
+                    + max(0, imag_cycles - 1) * self._inter_delay.value()
+                )
+            self._dur_cache[key] = value
+        return value
+
+    def _per_trial_duration(self) -> float:
+        # Instruction: MP3s play async during frame-counted waits
+        instruction_seq = 5.0 + 2.0
+        # Post: frame-counted 5 s wait, MP3 plays async during it
+        post_instruction = 5.0
+        return (self._phase_duration("training_phase")
+                + self._train_to_meas_delay.value() + instruction_seq
+                + self._phase_duration("measurement_phase") + post_instruction)
+
+    def _refresh_estimate_label(self, *_args) -> None:
+        if "imag" in self._placeholders:
+            return
+        self._estimate_label.setText(f"~{self._per_trial_duration():.0f} s per trial")
+
     def _show_estimated_duration(self) -> None:
         """Show a dialog with estimated experiment duration based on current settings."""
+        self._force_build_all()
         # Read current widget values
         n_shapes = sum(1 for cb in self._shape_checks.values() if cb.isChecked())
         if self._radio_images.isChecked():
-            n_shapes = max(1, self._image_list.count())
+            n_shapes = max(1, len(self._image_paths))
         if n_shapes == 0:
             QMessageBox.warning(self, "No Stimuli", "Select at least one shape or image.")
             return
 
         reps = self._reps.value()
         shape_reps = self._shape_reps.value()
-        train_reps = self._train_reps.value()
-        train_shape = self._train_shape_dur.value()
-        train_blank = self._train_blank_dur.value()
-        train_to_meas = self._train_to_meas_delay.value()
-        end_beep_dur = self._end_beep_dur.value()
-        imag_dur = self._imagination_dur.value()
-        imag_cycles = self._imagination_cycles.value()
-        inter_delay = self._inter_delay.value()
-
         # Per-trial duration (flip-accurate match of trial_protocol.py)
-        # Assume 60 Hz display for stop-flip overhead
-        frame_dur = 1.0 / 60.0
-
-        # Training: shape + end_beep + blank + 1 stop flip per rep
-        training_phase = train_reps * (
-            train_shape + end_beep_dur + train_blank + frame_dur
-        )
-        # Instruction: MP3s play async during frame-counted waits
-        instruction_seq = 5.0 + 2.0
-        # Measurement per cycle: imagination_dur + end_beep + 2 stop flips
-        # + camera start/stop overhead (~50ms per cycle)
-        camera_overhead = 0.05
-        measurement_phase = (
-            imag_cycles * (imag_dur + end_beep_dur + 2 * frame_dur + camera_overhead)
-            + max(0, imag_cycles - 1) * inter_delay
-        )
-        # Post: precise_sleep(5.0), MP3 plays async during it
-        post_instruction = 5.0
-        per_trial = (training_phase + train_to_meas + instruction_seq
-                     + measurement_phase + post_instruction)
+        per_trial = self._per_trial_duration()
 
         shapes_per_item = n_shapes * shape_reps
 
@@ -509,11 +666,14 @@ class ExperimentSettingsDialog(QDialog):
 
     def _save_defaults(self) -> None:
         self.apply_to_config(self._config)
-        defaults_path = Path(__file__).resolve().parent.parent.parent / "config" / "defaults.json"
-        self._config.save(defaults_path)
-        self._memory.update_settings(self._config.to_dict())
-        self._memory.last_output_folder = self._config.output_base_dir
-        self._memory.save()
+        data = self._config.to_dict()
+        # Repeated clicks on unchanged settings skip the disk writes
+        if data != self._saved_defaults:
+            self._config.save(_DEFAULTS_PATH)
+            self._memory.update_settings(data)
+            self._memory.last_output_folder = self._config.output_base_dir
+            self._memory.save()
+            self._saved_defaults = data
         QMessageBox.information(self, "Saved", "Defaults saved successfully.")
 
     def _on_next(self) -> None:
@@ -530,6 +690,7 @@ class ExperimentSettingsDialog(QDialog):
 
     def apply_to_config(self, config: ExperimentConfig) -> None:
         """Write widget values into the config object."""
+        self._force_build_all()
         config.shapes = [
             name for name, cb in self._shape_checks.items() if cb.isChecked()
         ]
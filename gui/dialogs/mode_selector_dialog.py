@@ -2,12 +2,36 @@
 
 from __future__ import annotations
 
-from PyQt5.QtCore import Qt
+from typing import Optional
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
 )
 
 
+class _DetectWorker(QObject, QRunnable):
+    """Runs the Basler scan on a pool thread and reports back via ``done``."""
+
+    done = pyqtSignal(bool, str)
+    failed = pyqtSignal(str)
+
+    def __init__(self):
+        QObject.__init__(self)
+        QRunnable.__init__(self)
+        # The dialog holds the Python reference; don't let Qt delete it
+        self.setAutoDelete(False)
+
+    def run(self) -> None:
+        try:
+            from hardware.camera_factory import detect_basler
+            detected, detail = detect_basler()
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.done.emit(detected, detail)
+
+
 class ModeSelectorDialog(QDialog):
     """First wizard step: choose between Lab Mode and Dev Mode."""
 
@@ -16,6 +40,7 @@ class ModeSelectorDialog(QDialog):
         self.setWindowTitle("Select Mode")
         self.setMinimumWidth(500)
         self._dev_mode = False
+        self._detect_worker: Optional[_DetectWorker] = None
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -63,22 +88,32 @@ class ModeSelectorDialog(QDialog):
         self.setLayout(layout)
 
     def _detect_camera(self) -> None:
-        """Check if a Basler camera is connected."""
-        try:
-            from hardware.camera_factory import detect_basler
-            detected, detail = detect_basler()
-            if detected:
-                self._status_label.setText(
-                    f'<span style="color:green;">Basler camera detected: {detail}</span>'
-                )
-            else:
-                self._status_label.setText(
-                    f'<span style="color:red;">No Basler camera: {detail}</span>'
-                )
-        except Exception as e:
+        """Check if a Basler camera is connected, without blocking the GUI.
+
+        The scan runs on the global thread pool; the status label is
+        updated when the (queued) result signal arrives.
+        """
+        self._status_label.setText("Detecting camera...")
+        worker = _DetectWorker()
+        worker.done.connect(self._on_detect_done)
+        worker.failed.connect(self._on_detect_failed)
+        self._detect_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_detect_done(self, detected: bool, detail: str) -> None:
+        if detected:
             self._status_label.setText(
-                f'<span style="color:orange;">Camera check failed: {e}</span>'
+                f'<span style="color:green;">Basler camera detected: {detail}</span>'
             )
+        else:
+            self._status_label.setText(
+                f'<span style="color:red;">No Basler camera: {detail}</span>'
+            )
+
+    def _on_detect_failed(self, msg: str) -> None:
+        self._status_label.setText(
+            f'<span style="color:orange;">Camera check failed: {msg}</span>'
+        )
 
     def _on_lab_mode(self) -> None:
         self._dev_mode = False
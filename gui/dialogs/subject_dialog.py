@@ -2,18 +2,72 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import Iterable, List
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView,
-    QMessageBox, QLabel, QListWidget, QListWidgetItem,
+    QTableView, QHeaderView,
+    QMessageBox, QLabel, QListWidget,
 )
 
 from data.app_memory import AppMemory
 
 
+class _SubjectTableModel(QAbstractTableModel):
+    """Editable (name, notes) rows backed by a plain Python list."""
+
+    HEADERS = ("Name", "Notes")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[List[str]] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role in (Qt.DisplayRole, Qt.EditRole):
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        self._rows[index.row()][index.column()] = str(value)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        return Qt.ItemIsEditable | Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def add(self, names: Iterable[str]) -> None:
+        """Append one row per name (empty notes) in a single insert."""
+        new = [[name, ""] for name in names]
+        if not new:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(new) - 1)
+        self._rows.extend(new)
+        self.endInsertRows()
+
+    def remove(self, row: int) -> None:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+
+    def names(self) -> List[str]:
+        return [name for name, _ in self._rows]
+
+
 class SubjectDialog(QDialog):
     """Wizard step 5: enter subject names, optionally load from history."""
 
@@ -46,8 +100,9 @@ class SubjectDialog(QDialog):
         layout.addLayout(btn_layout)
 
         # Table
-        self._table = QTableWidget(0, 2)
-        self._table.setHorizontalHeaderLabels(["Name", "Notes"])
+        self._model = _SubjectTableModel(self)
+        self._table = QTableView()
+        self._table.setModel(self._model)
         self._table.horizontalHeader().setSectionResizeMode(
             0, QHeaderView.Stretch,
         )
@@ -72,10 +127,7 @@ class SubjectDialog(QDialog):
         self._add_row()
 
     def _add_row(self) -> None:
-        row = self._table.rowCount()
-        self._table.insertRow(row)
-        self._table.setItem(row, 0, QTableWidgetItem(f"Subject_{row + 1}"))
-        self._table.setItem(row, 1, QTableWidgetItem(""))
+        self._model.add([f"Subject_{self._model.rowCount() + 1}"])
 
     def _remove_row(self) -> None:
         rows = sorted(
@@ -83,7 +135,7 @@ class SubjectDialog(QDialog):
             reverse=True,
         )
         for row in rows:
-            self._table.removeRow(row)
+            self._model.remove(row)
 
     def _load_from_history(self) -> None:
         """Open a multi-select dialog with previous subject names."""
@@ -104,8 +156,11 @@ class SubjectDialog(QDialog):
 
         list_widget = QListWidget()
         list_widget.setSelectionMode(QListWidget.MultiSelection)
-        for name in history:
-            list_widget.addItem(name)
+        # One-line names: skip per-item size hints, insert in one batch
+        list_widget.setUniformItemSizes(True)
+        list_widget.setUpdatesEnabled(False)
+        list_widget.addItems(history)
+        list_widget.setUpdatesEnabled(True)
         dlg_layout.addWidget(list_widget)
 
         btn_layout = QHBoxLayout()
@@ -121,12 +176,7 @@ class SubjectDialog(QDialog):
         dlg.setLayout(dlg_layout)
 
         if dlg.exec_() == QDialog.Accepted:
-            selected = [item.text() for item in list_widget.selectedItems()]
-            for name in selected:
-                row = self._table.rowCount()
-                self._table.insertRow(row)
-                self._table.setItem(row, 0, QTableWidgetItem(name))
-                self._table.setItem(row, 1, QTableWidgetItem(""))
+            self._model.add(item.text() for item in list_widget.selectedItems())
 
     def _on_confirm(self) -> None:
         subjects = self.get_subjects()
@@ -137,9 +187,5 @@ class SubjectDialog(QDialog):
 
     def get_subjects(self) -> List[str]:
         """Return list of non-empty subject names."""
-        names = []
-        for row in range(self._table.rowCount()):
-            item = self._table.item(row, 0)
-            if item and item.text().strip():
-                names.append(item.text().strip())
-        return names
+        stripped = (name.strip() for name in self._model.names())
+        return [name for name in stripped if name]
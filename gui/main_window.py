@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import importlib
+import json
 import logging
-from datetime import datetime, timedelta
+import threading
+import time
+from dataclasses import fields
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
@@ -13,7 +18,7 @@ from PyQt5.QtWidgets import (
     QMessageBox, QApplication,
 )
 
-from config.settings import ExperimentConfig
+from config.settings import CameraSettings, ExperimentConfig
 from core.enums import ExperimentState, TrialPhase
 from core.experiment_engine import ExperimentEngine
 from hardware.camera_factory import create_camera
@@ -28,6 +33,18 @@ from gui.panels.stimulus_mirror_panel import StimulusMirrorPanel
 
 logger = logging.getLogger(__name__)
 
+# CameraSettings is flat, so a getattr pass replaces asdict()'s recursion
+_CAMERA_FIELDS = tuple(f.name for f in fields(CameraSettings))
+
+# Imported in the background while the operator is on the first wizard
+# step, so later steps open without a cold-import pause.
+_PREWARM_MODULES = (
+    "gui.dialogs.subject_dialog",
+    "gui.dialogs.experiment_settings_dialog",
+    "gui.dialogs.camera_setup_dialog",
+    "gui.dialogs.display_audio_dialog",
+)
+
 
 class MainWindow(QMainWindow):
     """Top-level experiment GUI window.
@@ -53,12 +70,20 @@ class MainWindow(QMainWindow):
         # End-time estimation state
         self._end_time_timer: Optional[QTimer] = None
         self._total_estimated_sec: float = 0.0
-        self._per_item_sec: float = 0.0
+        # Cached by _init_end_time_tracking (config is fixed per session)
+        self._per_trial_sec: float = 0.0
         self._experiment_started = False
         self._last_queue_index = 0
-        self._expected_end: Optional[datetime] = None
+        # Expected end as a time.time() value, plus its (hour, minute)
+        self._expected_end_ts: Optional[float] = None
+        self._expected_end_hm = (0, 0)
+        # Last (hour, minute, remaining-minutes) shown; skips no-op redraws
+        self._last_end_display: Optional[tuple] = None
         # Track dead time (operator confirm waits + pause/resume gaps)
-        self._dead_time_start: Optional[datetime] = None
+        self._dead_time_start: Optional[float] = None  # time.time()
+        # Teardown guards: each step runs once however shutdown is reached
+        self._live_updates_stopped = False
+        self._shut_down = False
 
         self.setWindowTitle("LSCI Visual Mental Imagery Experiment")
         self.setMinimumSize(1100, 650)
@@ -70,6 +95,19 @@ class MainWindow(QMainWindow):
         """Override show to run wizard first."""
         super().show()
         QTimer.singleShot(100, self._run_wizard)
+        threading.Thread(
+            target=self._prewarm_dialogs, name="WizardPrewarm", daemon=True,
+        ).start()
+
+    @staticmethod
+    def _prewarm_dialogs() -> None:
+        """Import the wizard's later modules (no Qt objects are created)."""
+        for name in _PREWARM_MODULES:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                # The wizard's own import will surface the real error
+                logger.debug("Prewarm import of %s failed: %s", name, e)
 
     def _run_wizard(self) -> None:
         """Run the multi-step wizard dialogs sequentially."""
@@ -171,13 +209,22 @@ class MainWindow(QMainWindow):
         central.setLayout(main_layout)
 
     def _connect_signals(self) -> None:
-        cp = self.control_panel
-        cp.start_clicked.connect(self._on_start)
-        cp.pause_clicked.connect(self._on_pause)
-        cp.resume_clicked.connect(self._on_resume)
-        cp.confirm_clicked.connect(self._on_confirm)
-        cp.stop_clicked.connect(self._on_stop)
-        cp.adjust_camera_clicked.connect(self._on_adjust_camera)
+        self._control_actions = {
+            "start": self._on_start,
+            "pause": self._on_pause,
+            "resume": self._on_resume,
+            "confirm": self._on_confirm,
+            "stop": self._on_stop,
+            "adjust_camera": self._on_adjust_camera,
+        }
+        self.control_panel.action_requested.connect(self._on_control_action)
+
+    def _on_control_action(self, action: str) -> None:
+        handler = self._control_actions.get(action)
+        if handler is None:
+            logger.warning("Unknown control action: %s", action)
+            return
+        handler()
 
     def _setup_camera_preview(self) -> None:
         """Initialize camera preview after wizard."""
@@ -196,7 +243,7 @@ class MainWindow(QMainWindow):
           Measurement per cycle: imagination_dur + end_beep_dur + 2 stop flips
             + inter_delay between cycles (not after last)
             + camera start/stop overhead
-          Post: 5s sleep (MP3 plays async during sleep)
+          Post: 5s frame-counted wait (MP3 plays async during it)
         """
         t = self.config.timing
         a = self.config.audio
@@ -231,7 +278,7 @@ class MainWindow(QMainWindow):
             + max(0, t.imagination_cycles - 1) * t.inter_imagination_delay
         )
 
-        # Post-measurement: precise_sleep(5.0), MP3 plays async during it
+        # Post-measurement: 5s frame-counted wait, MP3 plays async during it
         post = 5.0
 
         return (training + t.training_to_measurement_delay
@@ -242,19 +289,13 @@ class MainWindow(QMainWindow):
         if not self.engine or not self.engine.queue:
             return
 
-        per_trial = self._estimate_per_trial_sec()
-        q = self.engine.queue
-        # Each queue item has N shapes
-        if q.items:
-            shapes_per_item = len(q.items[0].shapes)
-        else:
-            shapes_per_item = 1
-
-        self._per_item_sec = shapes_per_item * per_trial
-        self._total_estimated_sec = q.total * self._per_item_sec
+        self._per_trial_sec = self._estimate_per_trial_sec()
+        self._total_estimated_sec = (
+            self.engine.queue.total_shapes * self._per_trial_sec
+        )
         self._experiment_started = False
         self._last_queue_index = 0
-        self._expected_end = None
+        self._expected_end_ts = None
         self._dead_time_start = None
 
         # Show initial estimate as "duration" note
@@ -265,48 +306,63 @@ class MainWindow(QMainWindow):
         )
 
     def _start_end_time_clock(self) -> None:
-        """Start the 1-second timer that updates the end-time display.
+        """Start the end-time display clock.
+
+        A single-shot timer is re-armed for the moment the remaining
+        minute count next drops, rather than ticking every second.
 
         Sets a fixed expected_end = now + total_estimated_sec.
         This time only shifts forward when dead time is detected
         (operator confirm waits and pause/resume gaps).
         """
         self._experiment_started = True
-        self._expected_end = (
-            datetime.now() + timedelta(seconds=self._total_estimated_sec)
-        )
+        self._set_expected_end(time.time() + self._total_estimated_sec)
         if self._end_time_timer is None:
             self._end_time_timer = QTimer(self)
+            self._end_time_timer.setSingleShot(True)
             self._end_time_timer.timeout.connect(self._update_end_time_display)
-        self._end_time_timer.start(1000)
+        self._last_end_display = None
         self._update_end_time_display()
 
+    def _set_expected_end(self, ts: float) -> None:
+        self._expected_end_ts = ts
+        end = datetime.fromtimestamp(ts)
+        self._expected_end_hm = (end.hour, end.minute)
+
     def _update_end_time_display(self) -> None:
         """Display the fixed expected end time and remaining duration."""
-        if self._expected_end is None:
+        if self._expected_end_ts is None:
             return
 
-        now = datetime.now()
-        remaining = (self._expected_end - now).total_seconds()
+        remaining = self._expected_end_ts - time.time()
 
         if remaining <= 0:
-            self.queue_panel.end_time_panel.set_time(0, 0)
-            self.queue_panel.end_time_panel.set_note("Should be done!")
+            if self._last_end_display != "done":
+                self._last_end_display = "done"
+                self.queue_panel.end_time_panel.set_time(0, 0)
+                self.queue_panel.end_time_panel.set_note("Should be done!")
             return
 
-        self.queue_panel.end_time_panel.set_time(
-            self._expected_end.hour, self._expected_end.minute,
-        )
-
-        # Show remaining as note
         rem_min = int(remaining // 60)
-        h, m = divmod(rem_min, 60)
-        self.queue_panel.end_time_panel.set_note(
-            f"~{h:02d}:{m:02d} remaining"
-        )
+        shown = (*self._expected_end_hm, rem_min)
+        if shown != self._last_end_display:
+            self._last_end_display = shown
+            self.queue_panel.end_time_panel.set_time(shown[0], shown[1])
+            # Show remaining as note
+            h, m = divmod(rem_min, 60)
+            self.queue_panel.end_time_panel.set_note(
+                f"~{h:02d}:{m:02d} remaining"
+            )
+
+        # Wake up just after rem_min next changes (dead-time shifts call
+        # this method directly and re-arm the timer)
+        if self._end_time_timer is not None:
+            self._end_time_timer.start(int((remaining % 60) * 1000) + 50)
 
     def _stop_end_time_clock(self) -> None:
         """Stop the end-time update timer."""
+        # Later dead-time updates must not re-arm the single-shot timer
+        self._expected_end_ts = None
         if self._end_time_timer:
             self._end_time_timer.stop()
 
@@ -348,19 +404,23 @@ class MainWindow(QMainWindow):
         self._init_end_time_tracking()
 
         # Connect engine worker signals
+        # (explicitly queued: always delivered on the GUI thread, in order)
         worker = self.engine.start()
-        worker.state_changed.connect(self._on_state_changed)
-        worker.phase_changed.connect(self._on_phase_changed)
-        worker.queue_advanced.connect(self._on_queue_advanced)
-        worker.trial_completed.connect(self._on_trial_completed)
-        worker.progress_text.connect(self._on_progress_text)
-        worker.error_occurred.connect(self._on_error)
-        worker.session_finished.connect(self._on_session_finished)
-        worker.stimulus_update.connect(self._on_stimulus_update)
-        worker.beep_progress.connect(self._on_beep_progress)
-        worker.recording_started.connect(self._on_recording_started)
-        worker.recording_saved.connect(self._on_recording_saved)
-        worker.recording_discarded.connect(self._on_recording_discarded)
+        for signal, slot in (
+            (worker.state_changed, self._on_state_changed),
+            (worker.phase_changed, self._on_phase_changed),
+            (worker.queue_advanced, self._on_queue_advanced),
+            (worker.trial_completed, self._on_trial_completed),
+            (worker.progress_text, self._on_progress_text),
+            (worker.error_occurred, self._on_error),
+            (worker.session_finished, self._on_session_finished),
+            (worker.stimulus_update, self._on_stimulus_update),
+            (worker.beep_progress, self._on_beep_progress),
+            (worker.recording_started, self._on_recording_started),
+            (worker.recording_saved, self._on_recording_saved),
+            (worker.recording_discarded, self._on_recording_discarded),
+        ):
+            signal.connect(slot, Qt.QueuedConnection)
 
         self.control_panel.set_preparing()
         self.progress_panel.set_status("Please wait.. preparing the experiment...")
@@ -416,23 +476,21 @@ class MainWindow(QMainWindow):
         self._setup_camera_preview()
 
     def _log_camera_settings_change(self) -> None:
-        """Append current camera settings to camera_settings_changes.json."""
+        """Append current camera settings to camera_settings_changes.jsonl.
+
+        One JSON object per line, so each change is a single append.
+        """
         if not self.engine or not self.engine.session_mgr:
             return
         try:
-            import json
-            from dataclasses import asdict
-            log_path = self.engine.session_mgr.session_dir / "camera_settings_changes.json"
-            entries = []
-            if log_path.exists():
-                with open(log_path, "r", encoding="utf-8") as f:
-                    entries = json.load(f)
-            entries.append({
+            cam = self.config.camera
+            log_path = self.engine.session_mgr.session_dir / "camera_settings_changes.jsonl"
+            entry = {
                 "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "settings": asdict(self.config.camera),
-            })
-            with open(log_path, "w", encoding="utf-8") as f:
-                json.dump(entries, f, indent=2)
+                "settings": {name: getattr(cam, name) for name in _CAMERA_FIELDS},
+            }
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
             logger.info("Camera settings updated: %s", self.config.camera)
         except Exception as e:
             logger.warning("Failed to log camera settings change: %s", e)
@@ -444,22 +502,22 @@ class MainWindow(QMainWindow):
         if state == ExperimentState.WAITING_CONFIRM:
             self.progress_panel.set_status("Waiting for operator confirmation...")
             # Start tracking dead time (operator is idle)
-            self._dead_time_start = datetime.now()
+            self._dead_time_start = time.time()
         elif state == ExperimentState.PAUSED:
             # Start tracking dead time (experiment paused)
             if self._dead_time_start is None:
-                self._dead_time_start = datetime.now()
+                self._dead_time_start = time.time()
         elif state == ExperimentState.RUNNING:
             # Start the end-time clock on first transition to RUNNING
             if not self._experiment_started:
-                # First confirm: _expected_end is set to now() + total,
+                # First confirm: expected end is set to now + total,
                 # so discard any dead time from the initial WAITING_CONFIRM
                 self._dead_time_start = None
                 self._start_end_time_clock()
             # End dead time: shift expected_end forward by the idle gap
-            elif self._dead_time_start is not None and self._expected_end is not None:
-                dead_seconds = (datetime.now() - self._dead_time_start).total_seconds()
-                self._expected_end += timedelta(seconds=dead_seconds)
+            elif self._dead_time_start is not None and self._expected_end_ts is not None:
+                dead_seconds = time.time() - self._dead_time_start
+                self._set_expected_end(self._expected_end_ts + dead_seconds)
                 self._dead_time_start = None
                 self._update_end_time_display()
 
@@ -502,8 +560,8 @@ class MainWindow(QMainWindow):
         QMessageBox.critical(self, "Engine Error", msg)
 
     def _on_session_finished(self) -> None:
-        self._stop_end_time_clock()
-        self.camera_preview.stop_preview()
+        # Freeze clock and preview before the (modal) completion dialog
+        self._stop_live_updates()
 
         if self.engine and self.engine.queue and self.engine.queue.is_done:
             # Natural completion — show completion dialog, then exit
@@ -518,15 +576,26 @@ class MainWindow(QMainWindow):
         # Shut down the entire application
         self._shutdown()
 
+    def _stop_live_updates(self) -> None:
+        """Stop the end-time clock and camera preview (once)."""
+        if self._live_updates_stopped:
+            return
+        self._live_updates_stopped = True
+        self._stop_end_time_clock()
+        self.camera_preview.stop_preview()
+
     def _shutdown(self) -> None:
         """Clean up all resources and exit the application."""
+        if self._shut_down:
+            return
+        self._shut_down = True
         logger.info("Shutting down application")
-        self._stop_end_time_clock()
-        self.camera_preview.stop_preview()
+        self._stop_live_updates()
         if self.camera and self.camera.is_connected():
             self.camera.disconnect()
         self.camera = None
         self.engine = None
+        self._memory.flush()
         QApplication.quit()
 
     def closeEvent(self, event) -> None:
@@ -535,4 +604,5 @@ class MainWindow(QMainWindow):
             self.engine.request_abort()
         if self.camera and self.camera.is_connected():
             self.camera.disconnect()
+        self._memory.flush()
         super().closeEvent(event)
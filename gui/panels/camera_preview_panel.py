@@ -1,10 +1,13 @@
-"""Live camera preview panel using QTimer polling."""
+"""Live camera preview panel fed by frames pushed from the camera backend."""
 
 from __future__ import annotations
 
+import time
 from typing import Optional
 
-from PyQt5.QtCore import Qt, QTimer
+import cv2
+import numpy as np
+from PyQt5.QtCore import QSize, Qt, pyqtSignal
 from PyQt5.QtGui import QImage, QPixmap
 from PyQt5.QtWidgets import QGroupBox, QLabel, QVBoxLayout
 
@@ -12,9 +15,18 @@ from hardware.camera_base import CameraBackend
 
 
 class CameraPreviewPanel(QGroupBox):
-    """Displays a live feed from the camera backend via periodic polling."""
+    """Displays a live feed from the camera backend.
 
-    POLL_INTERVAL_MS = 50  # ~20 fps preview
+    The backend calls a frame listener from its grab/record thread; the
+    panel forwards at most one frame per ``FRAME_INTERVAL_MS`` to the GUI
+    thread through a queued signal, dropping frames while one is still
+    pending.
+    """
+
+    FRAME_INTERVAL_MS = 50  # ~20 fps preview cap
+
+    # Carries a numpy frame from the camera thread to the GUI thread
+    _frame_pushed = pyqtSignal(object)
 
     def __init__(self, parent=None):
         super().__init__("Camera Preview", parent)
@@ -34,42 +46,93 @@ class CameraPreviewPanel(QGroupBox):
         layout.addWidget(self._label)
         self.setLayout(layout)
 
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._poll_frame)
+        # (frame size, label size) -> scaled size, recomputed on change
+        self._scale_key = None
+        self._scaled_size = (0, 0)
+
+        self._min_interval = self.FRAME_INTERVAL_MS / 1000.0
+        self._last_push = 0.0
+        self._push_pending = False
+        self._active = False
+        self._frame_pushed.connect(self._on_frame_pushed, Qt.QueuedConnection)
 
     def set_camera(self, camera: CameraBackend) -> None:
         self._camera = camera
+        self._sync_preview_enabled()
 
     def start_preview(self) -> None:
         if self._camera and self._camera.is_connected():
-            self._timer.start(self.POLL_INTERVAL_MS)
+            self._push_pending = False
+            self._active = True
+            self._camera.set_frame_listener(self._on_camera_frame)
+            self._sync_preview_enabled()
 
     def stop_preview(self) -> None:
-        self._timer.stop()
+        self._active = False
+        if self._camera is not None:
+            self._camera.remove_frame_listener(self._on_camera_frame)
+            self._sync_preview_enabled()
         self._label.setText("Preview stopped")
 
-    def _poll_frame(self) -> None:
-        if self._camera is None:
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._sync_preview_enabled()
+
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
+        self._sync_preview_enabled()
+
+    def _sync_preview_enabled(self) -> None:
+        """Let the backend skip preview-only grabbing while hidden."""
+        if self._camera is not None:
+            self._camera.set_preview_enabled(self._active and self.isVisible())
+
+    def _on_camera_frame(self, frame) -> None:
+        """Camera thread: forward a frame if the GUI is ready for one."""
+        if self._push_pending:
             return
-        frame = self._camera.get_preview_frame()
-        if frame is None:
-            # Try a single grab for preview when not recording
-            if not self._camera.is_recording():
-                frame = self._camera.grab_frame()
-        if frame is not None:
-            self._display_frame(frame)
+        now = time.monotonic()
+        if now - self._last_push < self._min_interval:
+            return
+        self._last_push = now
+        self._push_pending = True
+        self._frame_pushed.emit(frame)
+
+    def _on_frame_pushed(self, frame) -> None:
+        self._push_pending = False
+        # A frame queued just before stop_preview() is dropped
+        if not self._active:
+            return
+        # Nothing would be seen: skip the conversion and scaling
+        if (not self.isVisible() or self.window().isMinimized()
+                or self.visibleRegion().isEmpty()):
+            return
+        self._display_frame(frame)
 
     def _display_frame(self, frame) -> None:
         h, w = frame.shape[:2]
-        if len(frame.shape) == 2:
+        label_size = self._label.size()
+        key = (w, h, label_size.width(), label_size.height())
+        if key != self._scale_key:
+            self._scale_key = key
+            target = QSize(w, h).scaled(label_size, Qt.KeepAspectRatio)
+            self._scaled_size = (max(1, target.width()), max(1, target.height()))
+        tw, th = self._scaled_size
+        if (tw, th) != (w, h):
+            # Resize in OpenCV (SIMD) before Qt sees the frame: area
+            # averaging when shrinking, nearest-neighbour when enlarging.
+            interp = cv2.INTER_AREA if tw < w else cv2.INTER_NEAREST
+            frame = cv2.resize(frame, (tw, th), interpolation=interp)
+            h, w = th, tw
+        elif not frame.flags["C_CONTIGUOUS"]:
+            # QImage wraps the numpy buffer directly; the row stride
+            # below assumes packed rows.
+            frame = np.ascontiguousarray(frame)
+
+        if frame.ndim == 2:
             # Grayscale
             qimg = QImage(frame.data, w, h, w, QImage.Format_Grayscale8)
         else:
             bytes_per_line = 3 * w
             qimg = QImage(frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-
-        pixmap = QPixmap.fromImage(qimg)
-        scaled = pixmap.scaled(
-            self._label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation,
-        )
-        self._label.setPixmap(scaled)
+        self._label.setPixmap(QPixmap.fromImage(qimg))
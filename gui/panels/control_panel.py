@@ -63,20 +63,43 @@ class SpinnerWidget(QWidget):
 
 
 class ControlPanel(QGroupBox):
-    """Experiment control buttons with dynamic visibility."""
-
-    start_clicked = pyqtSignal()
-    pause_clicked = pyqtSignal()
-    resume_clicked = pyqtSignal()
-    stop_clicked = pyqtSignal()
-    confirm_clicked = pyqtSignal()
-    adjust_camera_clicked = pyqtSignal()
+    """Experiment control buttons with dynamic visibility.
+
+    Every button press is reported through ``action_requested`` with one
+    of: "start", "pause", "resume", "confirm", "stop", "adjust_camera".
+    """
+
+    action_requested = pyqtSignal(str)
+
+    # Buttons shown in each state (attribute names); all others hidden
+    _VISIBLE_BUTTONS = {
+        ExperimentState.IDLE: ("_start_btn",),
+        ExperimentState.RUNNING: ("_pause_btn", "_stop_btn"),
+        ExperimentState.PAUSED: ("_pause_btn", "_stop_btn"),
+        ExperimentState.WAITING_CONFIRM: (
+            "_adjust_camera_btn", "_confirm_btn", "_stop_btn",
+        ),
+    }
+    _CLEARS_PREPARING = (
+        ExperimentState.WAITING_CONFIRM,
+        ExperimentState.COMPLETED,
+        ExperimentState.ABORTED,
+        ExperimentState.ERROR,
+    )
 
     def __init__(self, parent=None):
         super().__init__("Controls", parent)
         self._is_paused = False
         self._preparing = False  # True between Start and first WAITING_CONFIRM
         self._build_ui()
+        self._state_buttons = (
+            self._start_btn, self._pause_btn, self._adjust_camera_btn,
+            self._confirm_btn, self._stop_btn,
+        )
+        self._visible_by_state = {
+            state: tuple(getattr(self, name) for name in names)
+            for state, names in self._VISIBLE_BUTTONS.items()
+        }
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout()
@@ -86,7 +109,7 @@ class ControlPanel(QGroupBox):
         self._start_btn.setStyleSheet(
             "font-weight: bold; padding: 10px 20px; font-size: 13px;"
         )
-        self._start_btn.clicked.connect(self.start_clicked)
+        self._start_btn.clicked.connect(lambda: self.action_requested.emit("start"))
         btn_layout.addWidget(self._start_btn)
 
         self._pause_btn = QPushButton("Pause")
@@ -99,7 +122,9 @@ class ControlPanel(QGroupBox):
         self._adjust_camera_btn.setStyleSheet(
             "background-color: #37474f; color: white; padding: 10px;"
         )
-        self._adjust_camera_btn.clicked.connect(self.adjust_camera_clicked)
+        self._adjust_camera_btn.clicked.connect(
+            lambda: self.action_requested.emit("adjust_camera")
+        )
         self._adjust_camera_btn.hide()
         btn_layout.addWidget(self._adjust_camera_btn)
 
@@ -107,7 +132,7 @@ class ControlPanel(QGroupBox):
         self._confirm_btn.setStyleSheet(
             "background-color: #2e7d32; color: white; padding: 10px; font-weight: bold;"
         )
-        self._confirm_btn.clicked.connect(self.confirm_clicked)
+        self._confirm_btn.clicked.connect(lambda: self.action_requested.emit("confirm"))
         self._confirm_btn.hide()
         btn_layout.addWidget(self._confirm_btn)
 
@@ -115,7 +140,7 @@ class ControlPanel(QGroupBox):
         self._stop_btn.setStyleSheet(
             "background-color: #c62828; color: white; padding: 10px; font-weight: bold;"
         )
-        self._stop_btn.clicked.connect(self.stop_clicked)
+        self._stop_btn.clicked.connect(lambda: self.action_requested.emit("stop"))
         self._stop_btn.hide()
         btn_layout.addWidget(self._stop_btn)
 
@@ -145,11 +170,11 @@ class ControlPanel(QGroupBox):
 
     def _on_pause_toggle(self) -> None:
         if self._is_paused:
-            self.resume_clicked.emit()
+            self.action_requested.emit("resume")
             self._pause_btn.setText("Pause")
             self._is_paused = False
         else:
-            self.pause_clicked.emit()
+            self.action_requested.emit("pause")
             self._pause_btn.setText("Resume")
             self._is_paused = True
 
@@ -166,43 +191,22 @@ class ControlPanel(QGroupBox):
 
     def update_for_state(self, state: ExperimentState) -> None:
         """Show/hide buttons based on experiment state."""
-        # Hide all first
-        self._start_btn.hide()
-        self._pause_btn.hide()
-        self._adjust_camera_btn.hide()
-        self._confirm_btn.hide()
+        if state in self._CLEARS_PREPARING:
+            self._preparing = False  # Engine is ready (or finished)
+        preparing = state == ExperimentState.RUNNING and self._preparing
+        # Still initializing — keep showing "Please wait" with spinner
+        visible = () if preparing else self._visible_by_state.get(state, ())
+        for btn in self._state_buttons:
+            btn.setVisible(btn in visible)
+        self._wait_container.setVisible(preparing)
+        if preparing:
+            self._spinner.start()
+        else:
+            self._spinner.stop()
 
-        self._stop_btn.hide()
-        self._wait_container.hide()
-        self._spinner.stop()
-
-        if state == ExperimentState.IDLE:
-            self._start_btn.show()
-
-        elif state == ExperimentState.RUNNING:
-            if self._preparing:
-                # Still initializing — keep showing "Please wait" with spinner
-                self._wait_container.show()
-                self._spinner.start()
-                return
-            self._pause_btn.show()
-            self._stop_btn.show()
-
-        elif state == ExperimentState.PAUSED:
-            self._pause_btn.show()
+        if state == ExperimentState.PAUSED:
             self._pause_btn.setText("Resume")
             self._is_paused = True
-            self._stop_btn.show()
-
-        elif state == ExperimentState.WAITING_CONFIRM:
-            self._preparing = False  # Engine is ready
-            self._adjust_camera_btn.show()
-            self._confirm_btn.show()
-            self._stop_btn.show()
-
-        elif state in (ExperimentState.COMPLETED, ExperimentState.ABORTED, ExperimentState.ERROR):
-            self._preparing = False
-            pass
 
     def set_idle(self) -> None:
         """Reset to idle state."""
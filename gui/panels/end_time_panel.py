@@ -2,42 +2,120 @@
 
 from __future__ import annotations
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPalette, QColor
-from PyQt5.QtWidgets import QGroupBox, QVBoxLayout, QLabel, QLCDNumber
+from typing import Dict
+
+from PyQt5.QtCore import QRectF, Qt
+from PyQt5.QtGui import QColor, QPainter, QPixmap
+from PyQt5.QtWidgets import QGroupBox, QVBoxLayout, QLabel, QWidget
+
+
+class _SevenSegmentClock(QWidget):
+    """Red flat seven-segment "HH:MM" readout.
+
+    Each glyph is rasterized once into a QPixmap for the current widget
+    height; a repaint just blits five cached pixmaps.
+    """
+
+    _ON = QColor(255, 0, 0)
+    _BG = QColor(26, 26, 26)
+    _BORDER = QColor("#333333")
+
+    # Lit segments per glyph (a=top, then clockwise, g=middle)
+    _SEGMENTS = {
+        "0": "abcdef", "1": "bc", "2": "abdeg", "3": "abcdg", "4": "bcfg",
+        "5": "acdfg", "6": "acdefg", "7": "abc", "8": "abcdefg",
+        "9": "abcdfg", "-": "g",
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._text = "--:--"
+        self._sprites: Dict[str, QPixmap] = {}
+        self._sprite_height = 0
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+    def display(self, text: str) -> None:
+        if text != self._text:
+            self._text = text
+            self.update()
+
+    def _glyph_width(self, ch: str, h: int) -> int:
+        return max(2, int(h * (0.22 if ch == ":" else 0.55)))
+
+    def _sprite(self, ch: str, h: int) -> QPixmap:
+        if h != self._sprite_height:
+            self._sprites.clear()
+            self._sprite_height = h
+        pix = self._sprites.get(ch)
+        if pix is None:
+            pix = self._sprites[ch] = self._render_glyph(ch, h)
+        return pix
+
+    def _render_glyph(self, ch: str, h: int) -> QPixmap:
+        w = self._glyph_width(ch, h)
+        pix = QPixmap(w, h)
+        pix.fill(self._BG)
+        p = QPainter(pix)
+        p.setPen(Qt.NoPen)
+        p.setBrush(self._ON)
+        t = max(1.0, h * 0.1)  # segment thickness
+        half = h / 2
+        if ch == ":":
+            for cy in (h * 0.3, h * 0.7):
+                p.drawRect(QRectF((w - t) / 2, cy - t / 2, t, t))
+        else:
+            rects = {
+                "a": QRectF(t, 0, w - 2 * t, t),
+                "b": QRectF(w - t, t, t, half - 1.5 * t),
+                "c": QRectF(w - t, half + t / 2, t, half - 1.5 * t),
+                "d": QRectF(t, h - t, w - 2 * t, t),
+                "e": QRectF(0, half + t / 2, t, half - 1.5 * t),
+                "f": QRectF(0, t, t, half - 1.5 * t),
+                "g": QRectF(t, half - t / 2, w - 2 * t, t),
+            }
+            for seg in self._SEGMENTS.get(ch, ""):
+                p.drawRect(rects[seg])
+        p.end()
+        return pix
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self._BG)
+        painter.setPen(self._BORDER)
+        painter.drawRect(self.rect().adjusted(0, 0, -1, -1))
+
+        h = max(2, int(self.height() * 0.7))
+        gap = max(1, h // 8)
+        widths = [self._glyph_width(ch, h) for ch in self._text]
+        x = (self.width() - sum(widths) - gap * (len(widths) - 1)) // 2
+        y = (self.height() - h) // 2
+        for ch, w in zip(self._text, widths):
+            painter.drawPixmap(x, y, self._sprite(ch, h))
+            x += w + gap
+        painter.end()
 
 
 class EndTimePanel(QGroupBox):
     """Red seven-segment digital clock showing expected experiment end time.
 
-    Displays time in HH:MM (24-hour) format using Qt's QLCDNumber widget
-    for an authentic digital clock appearance.
+    Displays time in HH:MM (24-hour) format with cached seven-segment
+    glyph pixmaps for an authentic digital clock appearance.
     """
 
     def __init__(self, parent=None):
         super().__init__("Expected End Time", parent)
+        # Last values pushed to the widgets; identical updates are skipped
+        self._shown_time = "--:--"
+        self._shown_note = ""
         self._build_ui()
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout()
         layout.setContentsMargins(6, 10, 6, 6)
 
-        self._lcd = QLCDNumber(5)  # 5 digits: HH:MM
-        self._lcd.setSegmentStyle(QLCDNumber.Flat)
-        self._lcd.setFixedHeight(50)
-        self._lcd.setStyleSheet(
-            "background-color: #1A1A1A; "
-            "color: #FF0000; "
-            "border: 2px inset #333;"
-        )
-        # Set red digits via palette
-        palette = self._lcd.palette()
-        palette.setColor(QPalette.WindowText, QColor(255, 0, 0))
-        palette.setColor(QPalette.Window, QColor(26, 26, 26))
-        self._lcd.setPalette(palette)
-        self._lcd.display("--:--")
-
-        layout.addWidget(self._lcd)
+        self._clock = _SevenSegmentClock()
+        self._clock.setFixedHeight(50)
+        layout.addWidget(self._clock)
 
         self._note_label = QLabel("")
         self._note_label.setAlignment(Qt.AlignCenter)
@@ -48,13 +126,20 @@ class EndTimePanel(QGroupBox):
 
     def set_time(self, hours: int, minutes: int) -> None:
         """Update the display with a specific time in 24h format."""
-        self._lcd.display(f"{hours:02d}:{minutes:02d}")
+        text = f"{hours:02d}:{minutes:02d}"
+        if text != self._shown_time:
+            self._shown_time = text
+            self._clock.display(text)
 
     def set_note(self, text: str) -> None:
         """Set the small note text below the clock."""
-        self._note_label.setText(text)
+        if text != self._shown_note:
+            self._shown_note = text
+            self._note_label.setText(text)
 
     def clear(self) -> None:
         """Reset to idle display."""
-        self._lcd.display("--:--")
+        self._shown_time = "--:--"
+        self._shown_note = ""
+        self._clock.display("--:--")
         self._note_label.setText("")
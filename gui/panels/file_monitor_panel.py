@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import math
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QColor, QBrush
+from PyQt5.QtCore import QPointF, QSize, Qt, QTimer
+from PyQt5.QtGui import QBrush, QColor, QPen, QStaticText
 from PyQt5.QtWidgets import (
     QGroupBox, QVBoxLayout, QListWidget, QListWidgetItem, QLabel,
+    QStyledItemDelegate,
 )
 
 
@@ -36,9 +39,22 @@ class FileMonitorPanel(QGroupBox):
         DISCARDED: "  \u2717 DISCARDED",
     }
 
+    # Item data roles: current status, the bare file name and its
+    # pre-laid-out QStaticText (painted by _StatusDelegate)
+    STATUS_ROLE = Qt.UserRole
+    FILENAME_ROLE = Qt.UserRole + 1
+    STATIC_TEXT_ROLE = Qt.UserRole + 2
+
     def __init__(self, parent=None):
         super().__init__("Recording Files", parent)
         self._items: Dict[str, QListWidgetItem] = {}
+        # Running per-status tallies, kept in step with the items
+        self._counts = {self.RECORDING: 0, self.SAVED: 0, self.DISCARDED: 0}
+        # Count label / scroll are refreshed once per event-loop pass
+        self._count_dirty = False
+        self._scroll_pending = False
+        self._flush_scheduled = False
+        self._batch_depth = 0
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -48,6 +64,8 @@ class FileMonitorPanel(QGroupBox):
         self._list = QListWidget()
         self._list.setSelectionMode(QListWidget.NoSelection)
         self._list.setMaximumHeight(150)
+        self._list.setUniformItemSizes(True)
+        self._list.setItemDelegate(_StatusDelegate(self._list))
         layout.addWidget(self._list)
 
         self._count_label = QLabel("")
@@ -59,58 +77,148 @@ class FileMonitorPanel(QGroupBox):
 
     def add_recording(self, video_path: str) -> None:
         """Add a new file entry with 'recording' status."""
+        old = self._items.get(video_path)
+        if old is not None:
+            self._counts[old.data(self.STATUS_ROLE)] -= 1
         filename = Path(video_path).name
-        item = QListWidgetItem(filename + self._SUFFIX[self.RECORDING])
-        bg, fg = self._COLORS[self.RECORDING]
-        item.setBackground(QBrush(bg))
-        item.setForeground(QBrush(fg))
+        # The delegate paints name + badge and sizes the row itself
+        item = QListWidgetItem(filename)
+        item.setData(self.FILENAME_ROLE, filename)
+        item.setData(self.STATIC_TEXT_ROLE, QStaticText(filename))
+        item.setData(self.STATUS_ROLE, self.RECORDING)
         item.setFlags(item.flags() & ~Qt.ItemIsSelectable)
+        self._counts[self.RECORDING] += 1
         self._list.addItem(item)
         self._items[video_path] = item
-        self._list.scrollToBottom()
-        self._update_count()
+        self._scroll_pending = True
+        self._schedule_refresh()
 
     def mark_saved(self, video_path: str) -> None:
         """Update existing entry to 'saved' status."""
-        item = self._items.get(video_path)
-        if item is None:
-            return
-        filename = Path(video_path).name
-        item.setText(filename + self._SUFFIX[self.SAVED])
-        bg, fg = self._COLORS[self.SAVED]
-        item.setBackground(QBrush(bg))
-        item.setForeground(QBrush(fg))
-        self._update_count()
+        self._set_status(video_path, self.SAVED)
 
     def mark_discarded(self, video_path: str) -> None:
         """Update existing entry to 'discarded' status."""
-        item = self._items.get(video_path)
-        if item is None:
-            return
-        filename = Path(video_path).name
-        item.setText(filename + self._SUFFIX[self.DISCARDED])
-        bg, fg = self._COLORS[self.DISCARDED]
-        item.setBackground(QBrush(bg))
-        item.setForeground(QBrush(fg))
-        self._update_count()
+        self._set_status(video_path, self.DISCARDED)
 
     def clear(self) -> None:
         """Remove all entries."""
         self._list.clear()
         self._items.clear()
+        for status in self._counts:
+            self._counts[status] = 0
+        self._count_dirty = False
+        self._scroll_pending = False
         self._count_label.setText("")
 
+    def begin_batch(self) -> None:
+        """Suspend list repaints until the matching end_batch()."""
+        if self._batch_depth == 0:
+            self._list.setUpdatesEnabled(False)
+        self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        """Resume repaints and apply the pending label/scroll update."""
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._list.setUpdatesEnabled(True)
+            self._flush()
+
+    @contextmanager
+    def batch(self):
+        """Context manager around begin_batch()/end_batch()."""
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
+    def _schedule_refresh(self) -> None:
+        self._count_dirty = True
+        if self._batch_depth or self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+        QTimer.singleShot(0, self._flush)
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        if self._batch_depth:
+            return  # end_batch() flushes
+        if self._scroll_pending:
+            self._scroll_pending = False
+            self._list.scrollToBottom()
+        if self._count_dirty:
+            self._count_dirty = False
+            self._update_count()
+
+    def _set_status(self, video_path: str, status: str) -> None:
+        item = self._items.get(video_path)
+        if item is None:
+            return
+        old = item.data(self.STATUS_ROLE)
+        if old == status:
+            return
+        self._counts[old] -= 1
+        self._counts[status] += 1
+        # A role change only repaints this row (dataChanged), no relayout
+        item.setData(self.STATUS_ROLE, status)
+        self._schedule_refresh()
+
     def _update_count(self) -> None:
-        saved = sum(
-            1 for item in self._items.values()
-            if self._SUFFIX[self.SAVED] in item.text()
-        )
-        discarded = sum(
-            1 for item in self._items.values()
-            if self._SUFFIX[self.DISCARDED] in item.text()
-        )
+        saved = self._counts[self.SAVED]
+        discarded = self._counts[self.DISCARDED]
         total = len(self._items)
         parts = [f"{saved}/{total} saved"]
         if discarded:
             parts.append(f"{discarded} discarded")
         self._count_label.setText("  |  ".join(parts))
+
+
+class _StatusDelegate(QStyledItemDelegate):
+    """Paints a file row from its status role: colored fill + name + badge."""
+
+    _PAD = 4
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._badges = {
+            status: QStaticText(suffix)
+            for status, suffix in FileMonitorPanel._SUFFIX.items()
+        }
+        # Rows are sized for the widest badge so a status change never
+        # needs a relayout
+        self._badge_width = max(b.size().width() for b in self._badges.values())
+        # Fill brush and text pen per status, built once
+        self._brushes = {
+            status: (QBrush(bg), QPen(fg))
+            for status, (bg, fg) in FileMonitorPanel._COLORS.items()
+        }
+
+    def sizeHint(self, option, index) -> QSize:
+        name = index.data(FileMonitorPanel.STATIC_TEXT_ROLE)
+        hint = super().sizeHint(option, index)
+        if name is None:
+            return hint
+        width = name.size().width() + self._badge_width + 2 * self._PAD
+        height = max(hint.height(), option.fontMetrics.height() + self._PAD)
+        return QSize(math.ceil(width), height)
+
+    def paint(self, painter, option, index) -> None:
+        status = index.data(FileMonitorPanel.STATUS_ROLE)
+        name = index.data(FileMonitorPanel.STATIC_TEXT_ROLE)
+        if status is None or name is None:
+            super().paint(painter, option, index)
+            return
+        brush, pen = self._brushes[status]
+        rect = option.rect
+        painter.save()
+        painter.fillRect(rect, brush)
+        painter.setPen(pen)
+        painter.setFont(option.font)
+        y = rect.y() + (rect.height() - option.fontMetrics.height()) / 2
+        x = rect.x() + self._PAD
+        painter.drawStaticText(QPointF(x, y), name)
+        painter.drawStaticText(
+            QPointF(x + name.size().width(), y), self._badges[status],
+        )
+        painter.restore()
@@ -10,11 +10,40 @@ from core.enums import TrialPhase
 
 
 class ProgressPanel(QGroupBox):
-    """Shows overall and current-turn progress bars with phase label."""
+    """Shows overall and current-turn progress bars with phase label.
+
+    Setters skip the Qt call when the value equals the one last shown,
+    so repeated engine signals do not trigger relayout/repaint.
+    """
+
+    PHASE_NAMES = {
+        TrialPhase.TRAINING_SHAPE: "Training - Shape Display",
+        TrialPhase.TRAINING_BLANK: "Training - Blank",
+        TrialPhase.INSTRUCTION_CLOSE_EYES: "Instruction - Close Eyes",
+        TrialPhase.INSTRUCTION_WAIT: "Instruction - Waiting",
+        TrialPhase.INSTRUCTION_STARTING: "Instruction - Starting",
+        TrialPhase.INSTRUCTION_READY: "Instruction - Ready",
+        TrialPhase.MEASUREMENT_START_BEEP: "Measurement - Start Beep",
+        TrialPhase.MEASUREMENT_RECORDING_DELAY: "Measurement - Recording Delay",
+        TrialPhase.MEASUREMENT_IMAGINING: "Measurement - Imagining",
+        TrialPhase.MEASUREMENT_END_BEEP: "Measurement - End Beep",
+        TrialPhase.MEASUREMENT_INTER_DELAY: "Measurement - Inter-cycle Delay",
+        TrialPhase.INSTRUCTION_POST: "Instruction - Post",
+        TrialPhase.INTER_TRIAL: "Inter-trial Gap",
+    }
 
     def __init__(self, parent=None):
         super().__init__("Progress", parent)
         self._build_ui()
+        self._reset_shown()
+
+    def _reset_shown(self) -> None:
+        self._shown_phase = "Phase: Idle"
+        self._shown_overall = (0, 0)
+        self._shown_turn = (0, 0)
+        self._shown_overall_pct = 0
+        self._shown_turn_pct = 0
+        self._shown_status = "Ready"
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout()
@@ -48,40 +77,43 @@ class ProgressPanel(QGroupBox):
 
     def set_phase_text(self, text: str) -> None:
         """Set the phase label to arbitrary text."""
-        self._phase_label.setText(f"Phase: {text}")
+        self._set_phase_label(f"Phase: {text}")
 
     def set_phase(self, phase: TrialPhase, remaining: float) -> None:
-        phase_names = {
-            TrialPhase.TRAINING_SHAPE: "Training - Shape Display",
-            TrialPhase.TRAINING_BLANK: "Training - Blank",
-            TrialPhase.INSTRUCTION_CLOSE_EYES: "Instruction - Close Eyes",
-            TrialPhase.INSTRUCTION_WAIT: "Instruction - Waiting",
-            TrialPhase.INSTRUCTION_STARTING: "Instruction - Starting",
-            TrialPhase.INSTRUCTION_READY: "Instruction - Ready",
-            TrialPhase.MEASUREMENT_START_BEEP: "Measurement - Start Beep",
-            TrialPhase.MEASUREMENT_RECORDING_DELAY: "Measurement - Recording Delay",
-            TrialPhase.MEASUREMENT_IMAGINING: "Measurement - Imagining",
-            TrialPhase.MEASUREMENT_END_BEEP: "Measurement - End Beep",
-            TrialPhase.MEASUREMENT_INTER_DELAY: "Measurement - Inter-cycle Delay",
-            TrialPhase.INSTRUCTION_POST: "Instruction - Post",
-            TrialPhase.INTER_TRIAL: "Inter-trial Gap",
-        }
-        self._phase_label.setText(f"Phase: {phase_names.get(phase, str(phase))}")
+        self._set_phase_label(f"Phase: {self.PHASE_NAMES.get(phase, str(phase))}")
+
+    def _set_phase_label(self, text: str) -> None:
+        if text != self._shown_phase:
+            self._shown_phase = text
+            self._phase_label.setText(text)
 
     def set_overall_progress(self, current: int, total: int) -> None:
+        if (current, total) == self._shown_overall:
+            return
+        self._shown_overall = (current, total)
         pct = int(current / total * 100) if total > 0 else 0
-        self._overall_bar.setValue(pct)
+        if pct != self._shown_overall_pct:
+            self._shown_overall_pct = pct
+            self._overall_bar.setValue(pct)
         self._overall_bar.setFormat(f"{current}/{total} ({pct}%)")
 
     def set_turn_progress(self, current_shape: int, total_shapes: int) -> None:
+        if (current_shape, total_shapes) == self._shown_turn:
+            return
+        self._shown_turn = (current_shape, total_shapes)
         pct = int(current_shape / total_shapes * 100) if total_shapes > 0 else 0
-        self._turn_bar.setValue(pct)
+        if pct != self._shown_turn_pct:
+            self._shown_turn_pct = pct
+            self._turn_bar.setValue(pct)
         self._turn_bar.setFormat(f"{current_shape}/{total_shapes} shapes ({pct}%)")
 
     def set_status(self, text: str) -> None:
-        self._status_label.setText(text)
+        if text != self._shown_status:
+            self._shown_status = text
+            self._status_label.setText(text)
 
     def reset(self) -> None:
+        self._reset_shown()
         self._phase_label.setText("Phase: Idle")
         self._overall_bar.setValue(0)
         self._overall_bar.setFormat("0/0 (0%)")
@@ -26,6 +26,8 @@ class _MirrorCanvas(QWidget):
         self._shape_color = QColor(hex_color)
 
     def set_state(self, state: str) -> None:
+        if state == self._state:
+            return
         self._state = state
         self.update()
 
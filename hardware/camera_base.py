@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import numpy as np
 
@@ -14,6 +14,41 @@ from config.settings import CameraSettings
 class CameraBackend(ABC):
     """Protocol that all camera backends must implement."""
 
+    # Called on the camera thread with each new preview frame; see
+    # set_frame_listener().  Class-level default so subclasses need no
+    # extra __init__ wiring.
+    _frame_listener: Optional[Callable[[np.ndarray], None]] = None
+
+    def set_frame_listener(
+        self, listener: Optional[Callable[[np.ndarray], None]],
+    ) -> None:
+        """Register a callable that receives every new frame (push preview).
+
+        The listener runs on the camera's grab/record thread and must be
+        cheap and must not modify the array.  Pass None to remove it.
+        """
+        self._frame_listener = listener
+
+    def remove_frame_listener(self, listener) -> None:
+        """Remove *listener* if it is the one currently registered."""
+        if self._frame_listener == listener:
+            self._frame_listener = None
+
+    def _notify_frame(self, frame: np.ndarray) -> None:
+        listener = self._frame_listener
+        if listener is not None:
+            try:
+                listener(frame)
+            except Exception:
+                pass  # never let a preview consumer break acquisition
+
+    def set_preview_enabled(self, enabled: bool) -> None:
+        """Hint whether anyone is looking at the live preview.
+
+        Backends that grab frames only for preview may pause that work
+        while disabled.  Recording is unaffected.  Default: no-op.
+        """
+
     @abstractmethod
     def connect(self, settings: CameraSettings) -> None:
         """Connect to the camera and apply settings.
@@ -7,7 +7,7 @@ Adapts proven patterns from basler_camera_test.py:
 - ROI centering with even offsets
 - Auto-exposure/gain off before manual values
 - GrabStrategy_LatestImageOnly
-- MJPG codec via OpenCV VideoWriter
+- MJPG codec (PyAV when available, else OpenCV VideoWriter)
 - IsGrabbing/IsOpen cleanup guards
 """
 
@@ -19,11 +19,11 @@ import time
 from pathlib import Path
 from typing import Optional
 
-import cv2
 import numpy as np
 
 from config.settings import CameraSettings
 from .camera_base import CameraBackend
+from .video_writer import open_writer
 
 logger = logging.getLogger(__name__)
 
@@ -190,6 +190,7 @@ class BaslerCamera(CameraBackend):
                         frame = result.GetArray().copy()
                         with self._frame_lock:
                             self._latest_frame = frame
+                        self._notify_frame(frame)
                     if result:
                         result.Release()
             except Exception:
@@ -254,11 +255,7 @@ class BaslerCamera(CameraBackend):
 
     def _record_loop(self, output_path: Path, fps: float) -> None:
         s = self._settings
-        fourcc = cv2.VideoWriter_fourcc(*"MJPG")
-        writer = cv2.VideoWriter(
-            str(output_path), fourcc, fps,
-            (s.width, s.height), isColor=False,
-        )
+        writer = open_writer(output_path, fps, s.width, s.height)
         if not writer.isOpened():
             logger.error("Failed to open VideoWriter at %s", output_path)
             self._recording = False
@@ -279,8 +276,10 @@ class BaslerCamera(CameraBackend):
                     frame = result.GetArray()
                     writer.write(frame)
                     self._frames_captured += 1
+                    latest = frame.copy()
                     with self._frame_lock:
-                        self._latest_frame = frame.copy()
+                        self._latest_frame = latest
+                    self._notify_frame(latest)
                 if result:
                     result.Release()
         finally:
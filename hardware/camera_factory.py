@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+import threading
+import time
+from typing import Optional, Tuple
 
 from .camera_base import CameraBackend
 
+# Reopening the wizard within this window reuses the last scan
+DETECT_TTL_S = 5.0
+_detect_cache: Optional[Tuple[float, Tuple[bool, str]]] = None
+_detect_lock = threading.Lock()
+_tlf = None  # pylon.TlFactory singleton, fetched on first scan
+
 
 def create_camera(dev_mode: bool = False) -> CameraBackend:
     """Return the appropriate camera backend.
@@ -21,16 +29,41 @@ def create_camera(dev_mode: bool = False) -> CameraBackend:
         return BaslerCamera()
 
 
-def detect_basler() -> Tuple[bool, str]:
+def detect_basler(force: bool = False,
+                  ttl: float = DETECT_TTL_S) -> Tuple[bool, str]:
     """Check if a Basler camera is available.
 
+    Device enumeration is a full USB/GigE scan, so the result is reused
+    for *ttl* seconds unless *force* is set.
+
     Returns:
         (detected, detail): True + model name if found, False + reason otherwise.
     """
+    global _detect_cache
+    with _detect_lock:
+        now = time.monotonic()
+        if (not force and _detect_cache is not None
+                and now - _detect_cache[0] < ttl):
+            return _detect_cache[1]
+        result = _enumerate_basler()
+        _detect_cache = (time.monotonic(), result)
+        return result
+
+
+def invalidate_detection() -> None:
+    """Forget the cached ``detect_basler()`` result."""
+    global _detect_cache
+    with _detect_lock:
+        _detect_cache = None
+
+
+def _enumerate_basler() -> Tuple[bool, str]:
+    global _tlf
     try:
-        from pypylon import pylon
-        tlf = pylon.TlFactory.GetInstance()
-        devices = tlf.EnumerateDevices()
+        if _tlf is None:
+            from pypylon import pylon
+            _tlf = pylon.TlFactory.GetInstance()
+        devices = _tlf.EnumerateDevices()
         if devices:
             model = devices[0].GetModelName()
             serial = devices[0].GetSerialNumber()
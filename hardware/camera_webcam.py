@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import threading
 import time
+from collections import deque
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +14,7 @@ import numpy as np
 
 from config.settings import CameraSettings
 from .camera_base import CameraBackend
+from .video_writer import open_writer
 
 logger = logging.getLogger(__name__)
 
@@ -20,24 +22,36 @@ logger = logging.getLogger(__name__)
 class WebcamCamera(CameraBackend):
     """Webcam-based camera backend for testing without Basler hardware."""
 
+    WRITE_QUEUE_LEN = 8  # frames buffered between capture and encoder
+
     def __init__(self):
         self._cap: Optional[cv2.VideoCapture] = None
         self._settings: Optional[CameraSettings] = None
         self._recording = False
         self._record_thread: Optional[threading.Thread] = None
         self._frames_captured = 0
+        self._frames_dropped = 0
         self._latest_frame: Optional[np.ndarray] = None
         self._frame_lock = threading.Lock()
         self._stop_event = threading.Event()
         # Continuous grab thread for live preview even when not recording
         self._grab_thread: Optional[threading.Thread] = None
         self._grab_stop = threading.Event()
+        # Cleared while no preview is visible; the grab thread then idles
+        self._preview_enabled = threading.Event()
+        self._preview_enabled.set()
+        # Per-thread scratch gray frame, reused when a resize follows
+        # conversion (grab and record loops briefly overlap on handover)
+        self._scratch = threading.local()
 
     def connect(self, settings: CameraSettings) -> None:
         self._settings = settings
         self._cap = cv2.VideoCapture(0)
         if not self._cap.isOpened():
             raise RuntimeError("No webcam available for dev mode")
+        # Prefer a compressed / YUV transfer format over raw BGR (must be
+        # requested before the resolution on V4L2)
+        fmt = self._negotiate_fourcc()
         # Try to set resolution (best-effort)
         self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, settings.width)
         self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, settings.height)
@@ -45,7 +59,8 @@ class WebcamCamera(CameraBackend):
         native_fps = self._cap.get(cv2.CAP_PROP_FPS)
         self._native_fps = native_fps if native_fps > 0 else 30.0
         logger.info(
-            "Webcam connected (dev mode), native fps: %.1f", self._native_fps
+            "Webcam connected (dev mode), native fps: %.1f, format: %s",
+            self._native_fps, fmt or "default",
         )
         # Start continuous grab thread for live preview
         self._grab_stop.clear()
@@ -54,6 +69,18 @@ class WebcamCamera(CameraBackend):
         )
         self._grab_thread.start()
 
+    def _negotiate_fourcc(self) -> str:
+        """Ask the driver for MJPG, then YUY2; return what it reports."""
+        for code in ("MJPG", "YUY2"):
+            self._cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*code))
+            if self._fourcc_str() == code:
+                return code
+        return self._fourcc_str()
+
+    def _fourcc_str(self) -> str:
+        value = int(self._cap.get(cv2.CAP_PROP_FOURCC))
+        return "".join(chr((value >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00 ")
+
     def _grab_loop(self) -> None:
         """Continuously grab frames for preview when not recording."""
         while not self._grab_stop.is_set():
@@ -61,16 +88,28 @@ class WebcamCamera(CameraBackend):
                 # Recording thread handles reads — sleep briefly
                 time.sleep(0.05)
                 continue
+            if not self._preview_enabled.is_set():
+                # Nobody is watching — skip the USB read and conversion
+                self._preview_enabled.wait(timeout=0.1)
+                continue
             if not self.is_connected():
                 break
             ret, frame = self._cap.read()
             if ret:
                 gray = self._to_gray_resized(frame)
+                gray.setflags(write=False)
                 with self._frame_lock:
                     self._latest_frame = gray
+                self._notify_frame(gray)
             else:
                 time.sleep(0.01)
 
+    def set_preview_enabled(self, enabled: bool) -> None:
+        if enabled:
+            self._preview_enabled.set()
+        else:
+            self._preview_enabled.clear()
+
     def disconnect(self) -> None:
         self._grab_stop.set()
         if self._grab_thread is not None:
@@ -93,14 +132,16 @@ class WebcamCamera(CameraBackend):
         return None
 
     def get_preview_frame(self) -> Optional[np.ndarray]:
+        """Return the latest frame as a read-only array (copy it to modify)."""
         with self._frame_lock:
-            return self._latest_frame.copy() if self._latest_frame is not None else None
+            return self._latest_frame
 
     def start_recording(self, output_path: Path, fps: float) -> None:
         if self._recording:
             return
         self._stop_event.clear()
         self._frames_captured = 0
+        self._frames_dropped = 0
         self._recording = True
         self._record_thread = threading.Thread(
             target=self._record_loop,
@@ -114,11 +155,7 @@ class WebcamCamera(CameraBackend):
         # Use the webcam's native FPS for recording playback speed,
         # ignoring the requested fps (which is meant for Basler cameras)
         record_fps = getattr(self, '_native_fps', 30.0)
-        fourcc = cv2.VideoWriter_fourcc(*"MJPG")
-        writer = cv2.VideoWriter(
-            str(output_path), fourcc, record_fps,
-            (s.width, s.height), isColor=False,
-        )
+        writer = open_writer(output_path, record_fps, s.width, s.height)
         if not writer.isOpened():
             logger.error("Failed to open VideoWriter at %s", output_path)
             self._recording = False
@@ -129,25 +166,56 @@ class WebcamCamera(CameraBackend):
             record_fps, output_path,
         )
 
+        # Capture (this thread) and MJPG encoding run on separate threads,
+        # joined by a small bounded queue; the oldest frame is dropped if
+        # the encoder falls behind.
+        frames: deque = deque(maxlen=self.WRITE_QUEUE_LEN)
+        capture_done = threading.Event()
+        writer_thread = threading.Thread(
+            target=self._write_loop, args=(writer, frames, capture_done),
+            daemon=True,
+        )
+        writer_thread.start()
         try:
             while not self._stop_event.is_set():
                 ret, frame = self._cap.read()
                 if ret:
                     gray = self._to_gray_resized(frame)
-                    writer.write(gray)
-                    self._frames_captured += 1
+                    # Fresh array per frame, so it can be published as-is
+                    gray.setflags(write=False)
+                    if len(frames) == frames.maxlen:
+                        self._frames_dropped += 1
+                    frames.append(gray)
                     with self._frame_lock:
-                        self._latest_frame = gray.copy()
+                        self._latest_frame = gray
+                    self._notify_frame(gray)
                 else:
                     # Brief sleep to avoid busy-wait if read fails
                     time.sleep(0.01)
         finally:
+            capture_done.set()
+            writer_thread.join()
             writer.release()
             self._recording = False
             logger.info(
-                "Webcam recording stopped: %d frames captured", self._frames_captured
+                "Webcam recording stopped: %d frames captured, %d dropped",
+                self._frames_captured, self._frames_dropped,
             )
 
+    def _write_loop(self, writer, frames: deque,
+                    capture_done: threading.Event) -> None:
+        """Encode queued frames until capture has stopped and the queue is empty."""
+        while True:
+            try:
+                gray = frames.popleft()
+            except IndexError:
+                if capture_done.is_set():
+                    break
+                time.sleep(0.001)
+                continue
+            writer.write(gray)
+            self._frames_captured += 1
+
     def stop_recording(self) -> int:
         self._stop_event.set()
         if self._record_thread is not None:
@@ -166,11 +234,25 @@ class WebcamCamera(CameraBackend):
             "model": "Webcam (dev mode)",
             "serial": "N/A",
             "device_class": "USB",
+            "dropped_frames": self._frames_dropped,
         }
 
     def _to_gray_resized(self, frame: np.ndarray) -> np.ndarray:
-        """Convert BGR frame to grayscale and resize to configured ROI."""
-        if len(frame.shape) == 3:
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        """Convert BGR frame to grayscale and resize to configured ROI.
+
+        Always returns a newly allocated array (it gets published).
+        """
         s = self._settings
+        h, w = frame.shape[:2]
+        if (w, h) == (s.width, s.height):
+            # Native size already matches: conversion is the only work
+            if frame.ndim == 3:
+                return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            return frame
+        if frame.ndim == 3:
+            # The intermediate full-size gray frame is only scratch
+            buf = getattr(self._scratch, "gray", None)
+            if buf is None or buf.shape != (h, w):
+                buf = self._scratch.gray = np.empty((h, w), np.uint8)
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=buf)
         return cv2.resize(frame, (s.width, s.height))
@@ -0,0 +1,75 @@
+"""Grayscale MJPG video writer used by the camera record loops.
+
+Uses PyAV (FFmpeg) when it is installed so that JPEG encoding runs on
+several threads; otherwise falls back to cv2.VideoWriter.  Either way
+the output is a Motion-JPEG .avi, so every frame stays an independent
+intra-coded image.
+"""
+
+from __future__ import annotations
+
+import logging
+from fractions import Fraction
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+try:
+    import av
+except ImportError:
+    av = None
+
+logger = logging.getLogger(__name__)
+
+
+class _AvMjpegWriter:
+    """PyAV MJPEG encoder with the cv2.VideoWriter subset we use."""
+
+    def __init__(self, path: Path, fps: float, width: int, height: int):
+        self._container = av.open(str(path), mode="w")
+        self._stream = self._container.add_stream(
+            "mjpeg", rate=Fraction(fps).limit_denominator(1001),
+            # Near-lossless quantiser, comparable to OpenCV's MJPG default
+            options={"qmin": "1", "qmax": "3"},
+        )
+        self._stream.width = width
+        self._stream.height = height
+        self._stream.pix_fmt = "yuvj420p"
+        self._stream.thread_type = "SLICE"
+        self._stream.thread_count = 0  # FFmpeg picks one per core
+
+    def isOpened(self) -> bool:
+        return self._container is not None
+
+    def write(self, frame: np.ndarray) -> None:
+        vframe = av.VideoFrame.from_ndarray(frame, format="gray")
+        for packet in self._stream.encode(vframe):
+            self._container.mux(packet)
+
+    def release(self) -> None:
+        if self._container is None:
+            return
+        try:
+            for packet in self._stream.encode():  # flush
+                self._container.mux(packet)
+        finally:
+            self._container.close()
+            self._container = None
+
+
+def open_writer(path: Path, fps: float, width: int, height: int):
+    """Open a grayscale MJPG writer for *path*.
+
+    Returns an object with ``isOpened()``, ``write(frame)`` and
+    ``release()``; check ``isOpened()`` before use.
+    """
+    if av is not None:
+        try:
+            return _AvMjpegWriter(path, fps, width, height)
+        except Exception as e:
+            logger.warning("PyAV writer unavailable (%s), using OpenCV", e)
+    fourcc = cv2.VideoWriter_fourcc(*"MJPG")
+    return cv2.VideoWriter(
+        str(path), fourcc, fps, (width, height), isColor=False,
+    )
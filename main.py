@@ -22,6 +22,7 @@ from PyQt5.QtWidgets import QApplication
 
 from config.settings import ExperimentConfig
 from utils.logging_setup import setup_logging
+from utils.timing import enable_high_res_timer
 from gui.main_window import MainWindow
 
 
@@ -56,6 +57,7 @@ def main() -> None:
 
     # Setup logging (console only until session starts)
     setup_logging()
+    enable_high_res_timer()
 
     # Launch application
     app = QApplication(sys.argv)
@@ -7,12 +7,24 @@ allocation during the frame loop.
 
 from __future__ import annotations
 
-import math
 from typing import Union, List
 
+import numpy as np
+
 from core.enums import Shape
 
 
+def _unit_polygon(n: int, radii) -> np.ndarray:
+    """Vertices of an n-gon starting at 12 o'clock, radius per vertex."""
+    angles = np.radians(90.0 + np.arange(n) * (360.0 / n))
+    return np.column_stack((np.cos(angles), np.sin(angles))) * np.asarray(radii)[:, None]
+
+
+# Unit-radius vertices, scaled by size / 2 per stimulus
+_TRIANGLE_UNIT = _unit_polygon(3, np.ones(3))
+_STAR_UNIT = _unit_polygon(10, np.tile([1.0, 0.4], 5))  # inner radius 0.4
+
+
 def hex_to_psychopy(hex_color: str) -> list:
     """Convert '#RRGGBB' hex to PsychoPy [-1, 1] RGB list."""
     h = hex_color.lstrip("#")
@@ -70,27 +82,15 @@ def create_shape_stim(win, shape: Shape, size: float = 0.5, color: str = "white"
         )
 
     elif shape == Shape.TRIANGLE:
-        r = size / 2
-        vertices = []
-        for i in range(3):
-            angle = math.radians(90 + i * 120)
-            vertices.append((r * math.cos(angle), r * math.sin(angle)))
         return visual.ShapeStim(
-            win, vertices=vertices,
+            win, vertices=_TRIANGLE_UNIT * (size / 2),
             fillColor=color, lineColor=color,
             units="height",
         )
 
     elif shape == Shape.STAR:
-        outer = size / 2
-        inner = outer * 0.4
-        vertices = []
-        for i in range(10):
-            angle = math.radians(90 + i * 36)
-            r = outer if i % 2 == 0 else inner
-            vertices.append((r * math.cos(angle), r * math.sin(angle)))
         return visual.ShapeStim(
-            win, vertices=vertices,
+            win, vertices=_STAR_UNIT * (size / 2),
             fillColor=color, lineColor=color,
             units="height",
         )
@@ -4,7 +4,7 @@ Wraps ``psychopy.visual.Window`` with convenience methods for shape
 display, frame-counting, and ``callOnFlip`` registration.
 
 IMPORTANT: Must be created and used on the same thread (OpenGL context
-is thread-bound).  In this codebase, that is the engine QThread.
+is thread-bound).  In this codebase, that is the engine thread.
 """
 
 from __future__ import annotations
@@ -2,40 +2,188 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import time
 from pathlib import Path
+from typing import List, Optional
+
+
+class _SessionFormatter(logging.Formatter):
+    """``time | LEVEL | logger | message`` formatter with a fast path.
+
+    Equivalent to ``"%(asctime)s | %(levelname)-8s | %(name)-25s |
+    %(message)s"`` but assembled with one f-string instead of
+    %-formatting a record dict.  Records arrive many per second, so the
+    timestamp string is reused until the second changes instead of
+    calling ``strftime`` per record.
+    """
+
+    def __init__(self, datefmt: str):
+        super().__init__(datefmt=datefmt)
+        self._ts_cache = (-1, "")
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = (
+            f"{self.formatTime(record)} | {record.levelname:<8} | "
+            f"{record.name:<25} | {record.getMessage()}"
+        )
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            text = f"{text}\n{record.exc_text}"
+        if record.stack_info:
+            text = f"{text}\n{self.formatStack(record.stack_info)}"
+        return text
+
+    def formatTime(self, record: logging.LogRecord, datefmt=None) -> str:
+        sec = int(record.created)
+        if sec != self._ts_cache[0]:
+            self._ts_cache = (sec, time.strftime(self.datefmt, self.converter(sec)))
+        return self._ts_cache[1]
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that writes through a large buffer instead of per record.
+
+    The plain handler flushes after every record (one write syscall per
+    log line).  Here the stream is flushed every *flush_interval*
+    seconds by a daemon thread, immediately for records at
+    *flush_level* or above, and on close (``logging.shutdown`` closes
+    handlers at exit).
+    """
+
+    def __init__(self, filename, encoding: str = "utf-8",
+                 buffer_size: int = 64 * 1024, flush_interval: float = 30.0,
+                 flush_level: int = logging.WARNING):
+        self._buffer_size = buffer_size  # read by _open() in super().__init__
+        self._flush_level = flush_level
+        super().__init__(filename, encoding=encoding)
+        self._stop_flush = threading.Event()
+        threading.Thread(
+            target=self._flush_loop, args=(flush_interval,),
+            daemon=True, name="LogFlush",
+        ).start()
+
+    def _open(self):
+        return open(
+            self.baseFilename, self.mode, buffering=self._buffer_size,
+            encoding=self.encoding, errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self._flush_level:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _flush_loop(self, interval: float) -> None:
+        while not self._stop_flush.wait(interval):
+            self.flush()
+
+    def close(self) -> None:
+        self._stop_flush.set()
+        super().close()
+
+
+# Output handlers run on a QueueListener thread; loggers only enqueue.
+_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_queue_handler = logging.handlers.QueueHandler(_queue)
+_output_handlers: List[logging.Handler] = []
+_listener: Optional[logging.handlers.QueueListener] = None
+# Installed once / replaced per session, never accumulated
+_console_installed = False
+_session_handler: Optional[BufferedFileHandler] = None
+
+
+def _restart_listener() -> None:
+    """(Re)start the listener thread over the current output handlers."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()  # drains queued records first
+    _listener = logging.handlers.QueueListener(
+        _queue, *_output_handlers, respect_handler_level=True,
+    )
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread (idempotent)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+# Registered after logging's own atexit hook, so runs before it closes
+# the handlers
+atexit.register(stop_logging)
 
 
 def setup_logging(session_dir: Path | None = None, level: int = logging.INFO) -> None:
     """Configure root logger with console + optional file handler.
 
+    The root logger only gets a ``QueueHandler``; formatting and I/O
+    happen on a background ``QueueListener`` thread so logging never
+    blocks the engine thread.
+
     Args:
-        session_dir: If provided, a ``session.log`` file handler is added.
+        session_dir: If provided, a ``session.log`` file handler is added,
+            replacing (and closing) the previous session's one.
         level: Logging level for both handlers.
     """
+    global _console_installed, _session_handler
+    # None of the handlers print thread/process/caller fields; skip
+    # collecting them for every LogRecord
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+
     root = logging.getLogger()
     root.setLevel(level)
+    if _queue_handler not in root.handlers:
+        root.addHandler(_queue_handler)
 
-    fmt = logging.Formatter(
-        "%(asctime)s | %(levelname)-8s | %(name)-25s | %(message)s",
-        datefmt="%H:%M:%S",
-    )
+    fmt = _SessionFormatter(datefmt="%H:%M:%S")
 
+    added = False
     # Console handler (only add once)
-    if not any(isinstance(h, logging.StreamHandler) and h.stream is sys.stdout
-               for h in root.handlers):
+    if not _console_installed:
         console = logging.StreamHandler(sys.stdout)
         console.setLevel(level)
         console.setFormatter(fmt)
-        root.addHandler(console)
+        _output_handlers.append(console)
+        _console_installed = True
+        added = True
 
     # File handler for session
+    old_session = None
     if session_dir is not None:
         session_dir.mkdir(parents=True, exist_ok=True)
-        fh = logging.FileHandler(
+        fh = BufferedFileHandler(
             session_dir / "session.log", encoding="utf-8"
         )
         fh.setLevel(level)
         fh.setFormatter(fmt)
-        root.addHandler(fh)
+        old_session, _session_handler = _session_handler, fh
+        if old_session is not None:
+            _output_handlers.remove(old_session)
+        _output_handlers.append(fh)
+        added = True
+
+    if added or _listener is None:
+        _restart_listener()
+    if old_session is not None:
+        # The old listener drained into it on stop; safe to close now
+        old_session.close()
@@ -3,39 +3,74 @@
 from __future__ import annotations
 
 import threading
-from typing import Optional
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
 
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, pyqtSignal
 
 from core.enums import ExperimentState, TrialPhase, Shape
 
 
 class AtomicFlag:
-    """Thread-safe boolean flag."""
+    """Thread-safe boolean flag.
+
+    Backed by ``threading.Event``: reads are a plain attribute load (no
+    lock), and waiters can block on :meth:`wait` instead of polling.
+    Writes share one lock so that :meth:`test_and_set` and
+    :meth:`compare_and_set` are atomic with respect to ``set``/``clear``.
+    """
 
     def __init__(self, initial: bool = False):
-        self._value = initial
-        self._lock = threading.Lock()
+        self._event = threading.Event()
+        self._write_lock = threading.Lock()
+        if initial:
+            self._event.set()
 
     def set(self) -> None:
-        with self._lock:
-            self._value = True
+        with self._write_lock:
+            self._event.set()
 
     def clear(self) -> None:
-        with self._lock:
-            self._value = False
+        with self._write_lock:
+            self._event.clear()
 
     @property
     def is_set(self) -> bool:
-        with self._lock:
-            return self._value
-
-
-class ExperimentWorker(QThread):
-    """QThread wrapper for the experiment engine.
-
-    Signals are used to communicate state changes back to the GUI
-    thread safely. The engine's run method is called in the QThread.
+        return self._event.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the flag is set or *timeout* elapses; return the flag."""
+        return self._event.wait(timeout)
+
+    def test_and_set(self) -> bool:
+        """Set the flag and return its previous value, atomically."""
+        with self._write_lock:
+            prev = self._event.is_set()
+            self._event.set()
+        return prev
+
+    def compare_and_set(self, expected: bool, new: bool) -> bool:
+        """Set the flag to *new* only if it equals *expected*.
+
+        Returns True if the swap happened.
+        """
+        with self._write_lock:
+            if self._event.is_set() != expected:
+                return False
+            if new:
+                self._event.set()
+            else:
+                self._event.clear()
+        return True
+
+
+class ExperimentWorker(QObject):
+    """Engine thread plus the signals it reports through.
+
+    The engine's run method is called on a plain ``threading.Thread``
+    (no Qt event loop is needed there).  The worker object itself lives
+    in the GUI thread, so signals emitted from the engine thread are
+    delivered to GUI slots as queued calls.
     """
 
     # Signals emitted to GUI
@@ -52,9 +87,70 @@ class ExperimentWorker(QThread):
     recording_saved = pyqtSignal(str)              # video_path when recording completes
     recording_discarded = pyqtSignal(str)          # video_path when recording is discarded
 
+    # "Last value wins" signals whose GUI target only this worker drives:
+    # an identical repeat is dropped, and inside batch() only the newest
+    # value is delivered.  (progress_text is not here: the GUI also
+    # writes the status line itself.)
+    _COALESCED = frozenset({
+        "stimulus_update", "phase_changed", "beep_progress",
+    })
+
     def __init__(self, engine_run_func, parent=None):
         super().__init__(parent)
         self._run_func = engine_run_func
+        self._thread = threading.Thread(
+            target=self.run, name="ExperimentEngine", daemon=True,
+        )
+        # Engine-thread only: no locking needed
+        self._batch_depth = 0
+        self._pending: List[Tuple[str, tuple]] = []
+        self._last_sent: Dict[str, tuple] = {}
+
+    def post(self, name: str, *args: Any) -> None:
+        """Emit signal *name* with *args*, coalescing where allowed.
+
+        Other signals are always delivered, in order.
+        """
+        if self._batch_depth:
+            if name in self._COALESCED:
+                self._pending = [p for p in self._pending if p[0] != name]
+            self._pending.append((name, args))
+            return
+        if name in self._COALESCED:
+            if self._last_sent.get(name) == args:
+                return
+            self._last_sent[name] = args
+        getattr(self, name).emit(*args)
+
+    def begin_batch(self) -> None:
+        self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            pending, self._pending = self._pending, []
+            for name, args in pending:
+                self.post(name, *args)
+
+    @contextmanager
+    def batch(self):
+        """Hold posted signals and deliver them (coalesced) on exit."""
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def is_running(self) -> bool:
+        return self._thread.is_alive()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the engine thread; return True if it has finished."""
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
 
     def run(self):
         try:
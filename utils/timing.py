@@ -1,39 +1,128 @@
 """High-precision timing utilities for Windows.
 
-Windows time.sleep() has ~15ms granularity. For sub-ms timing needed
-in the trial protocol, we use a hybrid approach: sleep for the bulk
-then busy-wait spin for the final 2ms.
+Windows time.sleep() has ~15ms granularity on older Pythons; since
+Python 3.11 it waits on a CREATE_WAITABLE_TIMER_HIGH_RESOLUTION timer
+(Windows 10 1803+) and lands within a fraction of a millisecond.  For
+sub-ms timing needed in the trial protocol, we use a hybrid approach:
+sleep for the bulk then a short, self-tuned yielding spin.
 """
 
 from __future__ import annotations
 
+import atexit
+import logging
+import sys
 import time
 
-# Threshold below which we switch from sleep to busy-wait (seconds)
-_SPIN_THRESHOLD = 0.002  # 2 ms
+logger = logging.getLogger(__name__)
+
+# Only Windows sleeps coarsely enough to need the spin phase; POSIX
+# nanosleep already wakes within tens of microseconds
+_NEEDS_SPIN = sys.platform == "win32"
+
+# Threshold below which we switch from sleep to busy-wait (seconds);
+# assumes enable_high_res_timer() has brought the Windows tick to ~1 ms
+_SPIN_THRESHOLD = 0.0012  # 1.2 ms
+
+# Self-tuning sleep margin (after SDL_AccurateDelay): starts at the
+# threshold above, grows when time.sleep() overshoots the deadline and
+# decays towards the observed overshoot otherwise.  A plain float shared
+# by all threads; a racy update only costs one slightly-off estimate.
+# Low floor so the spin nearly vanishes with a high-resolution sleep
+_MIN_WAIT_RESOLUTION = 0.0002
+_MAX_WAIT_RESOLUTION = 0.005
+_WAIT_SAFETY = 0.0002
+_wait_resolution = _SPIN_THRESHOLD
 
 
 def precise_sleep(duration: float) -> None:
     """Sleep for *duration* seconds with sub-ms accuracy on Windows.
 
-    Uses time.sleep() for the bulk of the wait, then a busy-wait
-    spin loop for the final 2 ms to achieve high precision.
+    Elsewhere this is a plain time.sleep().
+
+    Uses time.sleep() for the bulk of the wait, then a spin loop for
+    the final ~2 ms (self-tuned to the measured sleep overshoot) to
+    achieve high precision.  Each spin iteration calls
+    time.sleep(0), which releases the GIL and yields the core, so the
+    GUI and camera threads keep running during the spin.
     """
+    global _wait_resolution
     if duration <= 0:
         return
+    if not _NEEDS_SPIN:
+        time.sleep(duration)
+        return
 
-    target = time.perf_counter() + duration
+    # Local bindings: the spin below calls these every iteration
+    now = time.perf_counter
+    sleep = time.sleep
+    target = now() + duration
 
-    # Sleep for the bulk (minus spin threshold)
-    sleep_duration = duration - _SPIN_THRESHOLD
+    # Sleep for the bulk (minus the current margin)
+    margin = _wait_resolution
+    sleep_duration = duration - margin
     if sleep_duration > 0:
-        time.sleep(sleep_duration)
+        sleep(sleep_duration)
+        late = now() - target
+        if late > 0:
+            # Missed the deadline: widen the margin at once
+            _wait_resolution = min(_MAX_WAIT_RESOLUTION, margin + late + _WAIT_SAFETY)
+        else:
+            # How far time.sleep() overshot what we asked for
+            overshoot = max(0.0, margin + late)
+            wanted = overshoot + _WAIT_SAFETY
+            _wait_resolution = max(
+                _MIN_WAIT_RESOLUTION, 0.9 * margin + 0.1 * wanted,
+            )
 
-    # Busy-wait spin for remaining time
-    while time.perf_counter() < target:
-        pass
+    # Yielding spin for remaining time
+    while now() < target:
+        sleep(0)
+
+
+_high_res_timer = False
+
+
+def enable_high_res_timer() -> bool:
+    """Request a 1 ms system timer period on Windows (once per process).
+
+    Brings ``time.sleep()`` granularity from ~15.6 ms down to ~1 ms so
+    that ``precise_sleep`` spends little time spinning.  The period is
+    restored at interpreter exit.  No-op elsewhere; returns True if the
+    1 ms period is in effect.
+    """
+    global _high_res_timer
+    if _high_res_timer or sys.platform != "win32":
+        return _high_res_timer
+    try:
+        import ctypes
+        winmm = ctypes.WinDLL("winmm")
+        if winmm.timeBeginPeriod(1) != 0:  # TIMERR_NOERROR
+            logger.warning("timeBeginPeriod(1) refused")
+            return False
+    except (OSError, AttributeError) as e:
+        logger.warning("High-resolution timer unavailable: %s", e)
+        return False
+    atexit.register(winmm.timeEndPeriod, 1)
+    _high_res_timer = True
+    logger.info("Windows timer period set to 1 ms")
+    return True
 
 
 def perf_timestamp() -> float:
     """Return a high-resolution monotonic timestamp (seconds)."""
     return time.perf_counter()
+
+
+def perf_timestamp_ns() -> int:
+    """Return a high-resolution monotonic timestamp (integer nanoseconds).
+
+    Differences of these are exact; compare against integer budgets
+    (e.g. ``t1 - t0 < 5_000_000`` for 5 ms) rather than float seconds.
+    """
+    return time.perf_counter_ns()
+
+
+def precise_sleep_ns(duration_ns: int) -> None:
+    """``precise_sleep`` taking an integer nanosecond duration."""
+    precise_sleep(duration_ns / 1e9)